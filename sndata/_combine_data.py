@@ -1,20 +1,38 @@
 """This module handles combining data from different data sets."""
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from functools import lru_cache
-from typing import List, Tuple, Union
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from astropy.table import Table, vstack
 
 from . import csp, des, essence, jla, loss, sdss, sweetspot
 from .exceptions import InvalidObjId, InvalidTableId, NoDownloadedData
-from .utils import wrappers
+from .utils import data_parsing, wrappers
 
 CombinedID = Union[str, Tuple[str, str, str]]
 
 
+# Data access classes for each bandpass prefix (``<survey>_<release>``)
+_band_prefix_classes = {
+    'csp_dr1': csp.DR1,
+    'csp_dr3': csp.DR3,
+    'des_sn3yr': des.SN3YR,
+    'essence_narayan16': essence.Narayan16,
+    'jla_betoule14': jla.Betoule14,
+    'sdss_sako18': sdss.Sako18,
+    'sweetspot_dr1': sweetspot.DR1,
+    'loss_ganeshalingam13': loss.Ganeshalingam13
+}
+
+
 # Todo: Test this function with a dedicated unit test
+@lru_cache(maxsize=None)
 def get_zp(band_name: str) -> float:
     """Return the zero point used by sndata for a given bandpass
 
@@ -27,20 +45,8 @@ def get_zp(band_name: str) -> float:
         The zero point as a float
     """
 
-    modules_dict = {
-        'csp_dr1': csp.DR1,
-        'csp_dr3': csp.DR3,
-        'des_sn3yr': des.SN3YR,
-        'essence_narayan16': essence.Narayan16,
-        'jla_betoule14': jla.Betoule14,
-        'sdss_sako18': sdss.Sako18,
-        'sweetspot_dr1': sweetspot.DR1,
-        'loss_ganeshalingam13': loss.Ganeshalingam13
-    }
-
     survey, release, *_ = band_name.split('_')
-    key = f'{survey}_{release}'
-    data_class = modules_dict[key]
+    data_class = _band_prefix_classes[f'{survey}_{release}']
     return data_class.get_zp_for_band(band_name)
 
 
@@ -54,31 +60,36 @@ def reduce_id_mapping(id_list: List[CombinedID]) -> list:
         A list of combined sets
     """
 
-    old_id_list = copy(id_list)
-    new_id_list = []
+    # Use a disjoint set forest to join sets with shared elements
+    parent = dict()
 
-    while old_id_list:
-        first, *rest = old_id_list
+    def find(obj_id):
+        # Return the root element while compressing the path to it
+        while parent[obj_id] != obj_id:
+            parent[obj_id] = parent[parent[obj_id]]
+            obj_id = parent[obj_id]
 
-        lf = -1
-        while len(first) > lf:
-            lf = len(first)
-            rest2 = []
-            for r in rest:
-                if len(first.intersection(r)) > 0:
-                    first |= r
+        return obj_id
 
-                else:
-                    rest2.append(r)
+    for id_set in id_list:
+        root = None
+        for obj_id in id_set:
+            parent.setdefault(obj_id, obj_id)
+            if root is None:
+                root = find(obj_id)
+                continue
 
-            rest = rest2
+            other_root = find(obj_id)
+            if other_root != root:
+                parent[other_root] = root
 
-        if len(first) > 1:
-            new_id_list.append(first)
+    # Group elements by root in order of first appearance
+    groups = dict()
+    for id_set in id_list:
+        for obj_id in id_set:
+            groups.setdefault(find(obj_id), set()).add(obj_id)
 
-        old_id_list = rest
-
-    return new_id_list
+    return [group for group in groups.values() if len(group) > 1]
 
 
 class CombinedDataset:
@@ -99,22 +110,131 @@ class CombinedDataset:
         self.publications = tuple(ds.publications for ds in data_sets)
         self.ads_url = tuple(ds.ads_url for ds in data_sets)
 
-        # Store data access classes for each data release
+        # Store data access classes for each data release keyed by
+        # (survey, release) so lookups don't need to format a string key.
+        # Releases keep the order they were passed in.
         self._data_releases = dict()
-        for module in set(data_sets):
-            module_id = f'{module.survey_abbrev}:{module.release}'
-            self._data_releases[module_id] = module
+        for module in data_sets:
+            module_id = (module.survey_abbrev, module.release)
+            self._data_releases.setdefault(module_id, module)
 
         self._joined_ids = []
+        self._joined_id_lookup = dict()
+        self._obj_id_cache = None
+        self._duplicate_ids = frozenset()
+        self._unique_id_frame = None
+        self._available_ids_cache = None
 
     @property
-    @lru_cache(None)
-    def _obj_id_dataframe(self):
+    def _obj_id_dataframe(self) -> pd.DataFrame:
         # Return a data frame of object ID's and their survey / release names
+        # The frame is built once from each data release and then reused
+
+        if self._obj_id_cache is None:
+            self._build_obj_id_frames()
+
+        return self._obj_id_cache
+
+    @property
+    def _unique_obj_id_dataframe(self) -> pd.DataFrame:
+        # Return rows of ``_obj_id_dataframe`` for string IDs that are unique
+        # across the combined data releases
+
+        if self._obj_id_cache is None:
+            self._build_obj_id_frames()
+
+        return self._unique_id_frame
+
+    def _build_obj_id_frames(self):
+        """Build the cached data frames of object IDs and shared string IDs"""
+
+        cache_path = self._id_cache_path()
+        if cache_path is not None and cache_path.exists():
+            id_frame = pd.read_csv(cache_path, dtype=str, keep_default_na=False)
+
+        else:
+            frames = []
+            for data_class in self._data_releases.values():
+                frames.append(pd.DataFrame({
+                    'obj_id': data_class.get_available_ids(),
+                    'release': data_class.release,
+                    'survey': data_class.survey_abbrev
+                }))
+
+            id_frame = pd.concat(frames, ignore_index=True)
+            if cache_path is not None:
+                self._write_id_cache(id_frame, cache_path)
+
+        # Survey and release names are heavily repeated, so store them
+        # as categories instead of individual string objects
+        id_frame = id_frame.astype({'release': 'category', 'survey': 'category'})
+
+        # A sorted index keeps ``get_loc`` a binary search even when
+        # some string IDs are shared by multiple data releases
+        id_frame = id_frame.set_index('obj_id').sort_index(kind='mergesort')
+
+        # Flag shared string IDs in a single vectorized pass
+        is_duplicate = id_frame.index.duplicated(keep=False)
+        self._duplicate_ids = frozenset(id_frame.index[is_duplicate])
+        self._unique_id_frame = id_frame[~is_duplicate]
+        self._obj_id_cache = id_frame
+
+    def _id_cache_path(self) -> Union[Path, None]:
+        """Return the path of the on disk cache for combined object IDs
+
+        The file name is a hash of the combined data releases followed by a
+        hash of the ``sndata`` version and the modification times of their
+        data directories, so the cache is ignored once the package or any
+        underlying data changes.
+
+        Returns:
+            The path of the cache file or None if data is not downloaded
+        """
+
+        # The package imports this module before defining its version
+        from . import __version__
+
+        release_parts = []
+        version_parts = [__version__]
+        for (survey_abbrev, release), data_class in sorted(self._data_releases.items()):
+            try:
+                data_version = data_class._get_data_version()
+
+            except (AttributeError, OSError):
+                return None
+
+            release_parts.append(f'{survey_abbrev}:{release}')
+            version_parts.append(str(data_version))
+
+        release_key = hashlib.blake2b('|'.join(release_parts).encode(), digest_size=8)
+        version_key = hashlib.blake2b('|'.join(version_parts).encode(), digest_size=8)
+        cache_dir = data_parsing.find_cache_dir('combined')
+        return cache_dir / f'obj_ids_{release_key.hexdigest()}_{version_key.hexdigest()}.csv'
+
+    @staticmethod
+    def _write_id_cache(id_frame: pd.DataFrame, cache_path: Path):
+        """Write combined object IDs to disk so later sessions can skip
+        scanning each data release
 
-        return pd.DataFrame(
-            self.get_available_ids(),
-            columns=['obj_id', 'release', 'survey']).set_index('obj_id')
+        Any cache written for the same data releases with an older package
+        version or older data is deleted.
+
+        Args:
+            id_frame: Data frame of object IDs, releases, and surveys
+            cache_path: Path of the cache file to write
+        """
+
+        release_key = cache_path.stem.split('_')[2]
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            id_frame.to_csv(cache_path, index=False)
+            for old_path in cache_path.parent.glob(f'obj_ids_{release_key}_*.csv'):
+                if old_path != cache_path:
+                    old_path.unlink()
+
+        except OSError:
+            # The cache is an optimization, so read only installs are fine
+            pass
 
     @property
     def band_names(self) -> Tuple[str]:
@@ -134,7 +254,12 @@ class CombinedDataset:
     def zero_point(self) -> Tuple[float]:
         """Get the zeropoint from each of the combined data releases"""
 
-        return tuple(get_zp(b) for b in self.band_names)
+        # Merge the band to zero point mappings cached by each release
+        zp_lookup = dict()
+        for release in self._data_releases.values():
+            zp_lookup.update(release._get_zp_lookup())
+
+        return tuple(zp_lookup[b] for b in self.band_names)
 
     def get_available_tables(self):
         """Get Ids for vizier tables published by the combined data releases"""
@@ -157,7 +282,7 @@ class CombinedDataset:
 
         survey_abbrev, release, table_id = table_id
         try:
-            data_class = self._data_releases[f'{survey_abbrev}:{release}']
+            data_class = self._data_releases[(survey_abbrev, release)]
             return data_class.load_table(table_id)
 
         except KeyError:
@@ -170,20 +295,38 @@ class CombinedDataset:
             A list of object IDs as tuples
         """
 
-        all_obj_ids = set()
-        for data_class in self._data_releases.values():
-            survey_abbrev = data_class.survey_abbrev
-            release = data_class.release
-            for obj_id in data_class.get_available_ids():
-                all_obj_ids.add((obj_id, release, survey_abbrev))
-
-        # Remove joined Id's
-        for obj_id_set in self._joined_ids:
-            obj_id_set = obj_id_set.copy()
-            obj_id_set.pop()
-            all_obj_ids -= obj_id_set
-
-        return sorted(all_obj_ids)
+        if self._available_ids_cache is None:
+            id_frame = self._obj_id_dataframe
+            obj_ids = id_frame.index.to_numpy()
+            releases = id_frame['release'].to_numpy()
+            surveys = id_frame['survey'].to_numpy()
+
+            # Sort on all three columns at once without building Python tuples
+            # Inferred categories are sorted, so their integer codes can
+            # stand in for the survey and release names as sort keys
+            order = np.lexsort((
+                id_frame['survey'].cat.codes.to_numpy(),
+                id_frame['release'].cat.codes.to_numpy(),
+                obj_ids))
+            sorted_ids = zip(
+                obj_ids[order].tolist(),
+                releases[order].tolist(),
+                surveys[order].tolist())
+
+            # Remove joined Id's
+            joined_ids = set()
+            for obj_id_set in self._joined_ids:
+                obj_id_set = obj_id_set.copy()
+                obj_id_set.pop()
+                joined_ids |= obj_id_set
+
+            # ``dict.fromkeys`` drops repeated IDs while preserving order
+            self._available_ids_cache = [
+                obj_id for obj_id in dict.fromkeys(sorted_ids)
+                if obj_id not in joined_ids
+            ]
+
+        return copy(self._available_ids_cache)
 
     def _get_data_single_id(
             self, obj_id: CombinedID, format_table: bool = True) -> Table:
@@ -202,21 +345,28 @@ class CombinedDataset:
             single_obj_id, release, survey_abbrev = obj_id
 
         # Get survey and release names from self._obj_id_dataframe
+        # using a hash lookup on the index instead of building a row Series
         else:
+            id_frame = self._obj_id_dataframe
+            if obj_id in self._duplicate_ids:
+                raise RuntimeError(f'Multiple results for obj_id: {obj_id}')
+
             try:
-                obj_id_parent = self._obj_id_dataframe.loc[obj_id]
+                row_num = id_frame.index.get_loc(obj_id)
 
             except KeyError:
                 raise InvalidObjId()
 
-            if not isinstance(obj_id_parent, pd.Series):
-                raise RuntimeError(f'Multiple results for obj_id: {obj_id}')
-
-            release = obj_id_parent.release
-            survey_abbrev = obj_id_parent.survey
+            release = id_frame['release'].iat[row_num]
+            survey_abbrev = id_frame['survey'].iat[row_num]
             single_obj_id = obj_id
 
-        data_class = self._data_releases[f"{survey_abbrev}:{release}"]
+        try:
+            data_class = self._data_releases[(survey_abbrev, release)]
+
+        except KeyError:
+            raise InvalidObjId()
+
         return data_class.get_data_for_id(single_obj_id, format_table)
 
     def _get_data_id_list(
@@ -235,15 +385,9 @@ class CombinedDataset:
             An astropy table of data for the given ID
         """
 
-        first_id = obj_id_list.pop()
-        combined_table = self._get_data_single_id(first_id, format_table)
-        combined_table.meta = {
-            first_id: combined_table.meta,
-            'obj_id': [first_id]
-        }
-
-        del combined_table.meta[first_id]['obj_id']
-
+        obj_id_list = list(obj_id_list)
+        combined_meta = {'obj_id': obj_id_list}
+        data_tables = []
         for obj_id in obj_id_list:
             data_table = self._get_data_single_id(obj_id, format_table)
 
@@ -251,10 +395,12 @@ class CombinedDataset:
             data_table.meta = {}
             del new_meta['obj_id']
 
-            combined_table = vstack((combined_table, data_table))
-            combined_table.meta['obj_id'].append(obj_id)
-            combined_table.meta[obj_id] = new_meta
+            combined_meta[obj_id] = new_meta
+            data_tables.append(data_table)
 
+        # Stack all tables at once instead of growing the combined table
+        combined_table = vstack(data_tables)
+        combined_table.meta = combined_meta
         return combined_table
 
     def get_data_for_id(
@@ -271,40 +417,98 @@ class CombinedDataset:
             An astropy table of data for the given ID
         """
 
-        for id_set in self._joined_ids:
-            if obj_id in id_set:
-                return self._get_data_id_list(id_set, format_table)
+        id_set = self._joined_id_lookup.get(obj_id)
+        if id_set is not None:
+            return self._get_data_id_list(id_set, format_table)
 
         return self._get_data_single_id(obj_id, format_table)
 
+    def get_data_for_ids(
+            self, obj_ids: Iterable[CombinedID], format_table: bool = True
+    ) -> List[Table]:
+        """Return data for multiple object IDs
+
+        Equivalent to calling ``get_data_for_id`` for each ID, but string IDs
+        are resolved to their survey and release in a single vectorized pass.
+
+        Args:
+            obj_ids: The IDs of the desired objects
+            format_table: Format data for SNCosmo.fit_lc (Default: True)
+
+        Returns:
+            A list of astropy tables in the same order as ``obj_ids``
+        """
+
+        obj_ids = list(obj_ids)
+        str_ids = [obj_id for obj_id in obj_ids if not isinstance(obj_id, tuple)]
+
+        # Look up positions of all string IDs at once using only IDs that
+        # are unique across the combined data releases
+        resolved_ids = dict()
+        if str_ids:
+            unique_frame = self._unique_obj_id_dataframe
+            positions = unique_frame.index.get_indexer(str_ids)
+            releases = unique_frame['release'].to_numpy()
+            surveys = unique_frame['survey'].to_numpy()
+            for obj_id, row_num in zip(str_ids, positions):
+                if row_num >= 0:
+                    resolved_ids[obj_id] = (releases[row_num], surveys[row_num])
+
+        data_tables = []
+        for obj_id in obj_ids:
+            if isinstance(obj_id, tuple):
+                data_tables.append(self.get_data_for_id(obj_id, format_table))
+                continue
+
+            if obj_id in self._duplicate_ids:
+                raise RuntimeError(f'Multiple results for obj_id: {obj_id}')
+
+            if obj_id not in resolved_ids:
+                raise InvalidObjId()
+
+            release, survey_abbrev = resolved_ids[obj_id]
+            data_class = self._data_releases[(survey_abbrev, release)]
+            data_tables.append(data_class.get_data_for_id(obj_id, format_table))
+
+        return data_tables
+
     def iter_data(
             self,
             verbose: Union[bool, dict] = False,
             format_table: bool = True,
-            filter_func: callable = None) -> Table:
+            filter_func: callable = None,
+            filter_id_func: callable = None) -> Table:
         """Iterate through all available targets and yield data tables
 
         An optional progress bar can be formatted by passing a dictionary of
         ``tqdm`` arguments. Outputs can be optionally filtered by passing a
         function ``filter_func`` that accepts a data table and returns a
-        boolean.
+        boolean. Targets can also be skipped before their data is read by
+        passing a function ``filter_id_func`` that accepts an object ID and
+        returns a boolean.
 
         Args:
             verbose: Optionally display progress bar while iterating
             format_table: Format data for ``SNCosmo`` (Default: True)
             filter_func: An optional function to filter outputs by
+            filter_id_func: An optional function to filter object IDs by
 
         Yields:
             Astropy tables
         """
 
+        # Default to returning only non-empty tables
         if filter_func is None:
-            filter_func = lambda x: x
+            filter_func = len
+
+        obj_ids = self.get_available_ids()
+        if filter_id_func is not None:
+            obj_ids = [obj_id for obj_id in obj_ids if filter_id_func(obj_id)]
 
-        for obj_id in wrappers.build_pbar(self.get_available_ids(), verbose):
-            data = self.get_data_for_id(obj_id, format_table=format_table)
-            if filter_func(data):
-                yield data
+        for obj_id in wrappers.build_pbar(obj_ids, verbose):
+            data_table = self.get_data_for_id(obj_id, format_table=format_table)
+            if filter_func(data_table):
+                yield data_table
 
     def register_filters(self, force: bool = False):
         """Register filters for the combined data releases with sncosmo
@@ -318,8 +522,7 @@ class CombinedDataset:
                 data_class.register_filters(force=force)
 
             except NoDownloadedData:
-                raise NoDownloadedData(
-                    f'No data downloaded for {data_class.__name__}')
+                raise NoDownloadedData(f'No data downloaded for {data_class}')
 
     def download_module_data(self, force: bool = False, timeout: int = 15):
         """Download data for all combined data releases
@@ -329,8 +532,21 @@ class CombinedDataset:
             timeout: Seconds before timeout for individual files/archives
         """
 
-        for name, module in self._data_releases.items():
-            module.download_module_data(force=force, timeout=timeout)
+        # Downloads are network bound, so fetch each data release concurrently.
+        # Requests from all releases share a module wide limit on open
+        # connections, so this only bounds the number of releases in progress.
+        max_workers = max(1, min(4, len(self._data_releases)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(module.download_module_data, force=force, timeout=timeout)
+                for module in self._data_releases.values()
+            ]
+
+            # Re-raise any errors encountered while downloading
+            for future in futures:
+                future.result()
+
+        self.clear_cache()
 
     def delete_module_data(self):
         """Delete any data for all combined surveys / data releases"""
@@ -338,6 +554,22 @@ class CombinedDataset:
         for module in self._data_releases.values():
             module.delete_module_data()
 
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear cached values for the combined data releases
+
+        Caches are cleared automatically when downloading or deleting data.
+        """
+
+        for module in self._data_releases.values():
+            module.clear_cache()
+
+        self._obj_id_cache = None
+        self._duplicate_ids = frozenset()
+        self._unique_id_frame = None
+        self._available_ids_cache = None
+
     def get_joined_ids(self) -> List[CombinedID]:
         """Return a list of joined object IDs
 
@@ -347,6 +579,18 @@ class CombinedDataset:
 
         return copy(self._joined_ids)
 
+    def _set_joined_ids(self, joined_ids: List[set]):
+        """Set the joined object IDs and rebuild the ID to joined set lookup
+
+        Args:
+            joined_ids: List of sets of joined object IDs
+        """
+
+        self._joined_ids = joined_ids
+        self._available_ids_cache = None
+        self._joined_id_lookup = {
+            obj_id: id_set for id_set in joined_ids for obj_id in id_set}
+
     def join_ids(self, *obj_ids: CombinedID):
         """Join object ID values to indicate the same object
 
@@ -362,7 +606,7 @@ class CombinedDataset:
             raise TypeError('Can only join object Id\'s as tuples')
 
         self._joined_ids.append(set(obj_ids))
-        self._joined_ids = reduce_id_mapping(self._joined_ids)
+        self._set_joined_ids(reduce_id_mapping(self._joined_ids))
 
     def separate_ids(self, *obj_ids: CombinedID):
         """Separate object IDs so they are no longer joined to other IDs
@@ -379,4 +623,4 @@ class CombinedDataset:
         for obj_id_set in self._joined_ids:
             obj_id_set -= obj_ids
 
-        self._joined_ids = reduce_id_mapping(self._joined_ids)
+        self._set_joined_ids(reduce_id_mapping(self._joined_ids))
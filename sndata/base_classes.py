@@ -6,7 +6,10 @@ docs.
 """
 
 import abc
+import os
 import shutil
+from copy import deepcopy
+from functools import partial
 from pathlib import Path
 from typing import List
 from typing import Union, Tuple
@@ -117,15 +120,48 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
 
         self._data_dir = data_parsing.find_data_dir(self.survey_abbrev, self.release)
         self._table_dir = self._data_dir / 'tables'
+        self._cache_dir = data_parsing.find_cache_dir(f'{self.survey_abbrev}_{self.release}')
+
+        # Cached table IDs stored as (data version, IDs) and object IDs
+        # stored as (data version, IDs, set of IDs)
+        self._ids_cache = None
+        self._tables_cache = None
+
+        # Parsed tables returned by ``load_table`` keyed by table ID
+        self._loaded_tables = dict()
+
+    def _get_data_version(self) -> tuple:
+        """Return modification times of the data directory and its subdirectories
+
+        Adding or removing a file changes the modification time of the
+        directory containing it, so cached values are reused only while the
+        returned value is unchanged.
+
+        Returns:
+            A tuple of modification times in nanoseconds
+        """
+
+        with os.scandir(self._data_dir) as entries:
+            subdir_mtimes = sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries if entry.is_dir()
+            )
+
+        return self._data_dir.stat().st_mtime_ns, tuple(subdir_mtimes)
 
     def get_available_tables(self) -> List[VizierTableId]:
         """Get Ids for available vizier tables published by this data release"""
 
         # Raise error if data is not downloaded
         data_parsing.require_data_path(self._data_dir)
-        return self._get_available_tables()
 
-    @wrappers.lru_copy_cache(maxsize=200_000_000)
+        # Avoid re-scanning the file system unless the data has changed
+        data_version = self._get_data_version()
+        if self._tables_cache is None or self._tables_cache[0] != data_version:
+            self._tables_cache = (data_version, list(self._get_available_tables()))
+
+        return list(self._tables_cache[1])
+
     @wrappers.ignore_warnings_wrapper
     def load_table(self, table_id: VizierTableId) -> Table:
         """Return a Vizier table published by this data release
@@ -134,11 +170,34 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
             table_id: The published table number or table name
         """
 
-        # Raise error if data is not downloaded
-        if table_id not in self.get_available_tables():
-            raise InvalidTableId(f'Table {table_id} is not available.')
+        # Return a copy so callers cannot modify the cached table
+        if table_id not in self._loaded_tables:
+            # Raise error if data is not downloaded
+            if table_id not in self.get_available_tables():
+                raise InvalidTableId(f'Table {table_id} is not available.')
+
+            self._loaded_tables[table_id] = self._load_table(table_id)
+
+        return deepcopy(self._loaded_tables[table_id])
+
+    def _get_cached_ids(self) -> Tuple[List[str], frozenset]:
+        """Return available object IDs as both a list and a set
+
+        The file system is only re-scanned if the data has changed. Returned
+        values are cached and should not be modified.
 
-        return self._load_table(table_id)
+        Returns:
+            The sorted object IDs and a set of the same IDs
+        """
+
+        data_parsing.require_data_path(self._data_dir)
+
+        data_version = self._get_data_version()
+        if self._ids_cache is None or self._ids_cache[0] != data_version:
+            obj_ids = list(self._get_available_ids())
+            self._ids_cache = (data_version, obj_ids, frozenset(obj_ids))
+
+        return self._ids_cache[1], self._ids_cache[2]
 
     def get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey
@@ -147,10 +206,8 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
             A list of object IDs as strings
         """
 
-        data_parsing.require_data_path(self._data_dir)
-        return self._get_available_ids()
+        return list(self._get_cached_ids()[0])
 
-    @wrappers.ignore_warnings_wrapper
     def get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
         """Returns data for a given object ID
 
@@ -164,52 +221,109 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
+        if obj_id not in self._get_cached_ids()[1]:
             raise InvalidObjId(f'Object Id not available: {obj_id}')
 
+        return self._get_data_for_available_id(obj_id, format_table)
+
+    @wrappers.ignore_warnings_wrapper
+    def _get_data_for_available_id(self, obj_id: str, format_table: bool = True) -> Table:
+        """Returns data for an object ID that is known to be available
+
+        Skips validating ``obj_id`` so that checking the file system for
+        changes is not repeated for every object in ``iter_data``.
+
+        Args:
+            obj_id: The ID of the desired object
+            format_table: Format data into the ``sndata`` standard format
+
+        Returns:
+            An astropy table of data for the given ID
+        """
+
         return self._get_data_for_id(obj_id, format_table)
 
     def iter_data(
             self,
             verbose: bool = False,
             format_table: bool = True,
-            filter_func: bool = None) -> Table:
+            filter_func: callable = None,
+            filter_id_func: callable = None,
+            n_jobs: int = 1) -> Table:
         """Iterate through all available targets and yield data tables
 
         An optional progress bar can be formatted by passing a dictionary of
         ``tqdm`` arguments. Outputs can be optionally filtered by passing a
         function ``filter_func`` that accepts a data table and returns a
-        boolean.
+        boolean. Targets can also be skipped before their data is read by
+        passing a function ``filter_id_func`` that accepts an object ID and
+        returns a boolean. Data files can be parsed in parallel processes by
+        setting ``n_jobs``. Tables are always yielded in the same order as
+        ``get_available_ids``.
 
         Args:
             verbose: Optionally display progress bar while iterating
             format_table: Format data for ``SNCosmo`` (Default: True)
             filter_func: An optional function to filter outputs by
+            filter_id_func: An optional function to filter object IDs by
+            n_jobs: Number of worker processes used to parse data. Data is
+                parsed serially unless greater than 1 (Default: 1)
 
         Yields:
             Astropy tables
         """
 
-        # Default to returning only non-empty tables
+        # Default to returning only non-empty tables. ``len`` is a builtin,
+        # so this avoids an extra Python frame for every table.
         if filter_func is None:
-            filter_func = lambda x: x
+            filter_func = len
+
+        obj_ids = self.get_available_ids()
+        if filter_id_func is not None:
+            obj_ids = [obj_id for obj_id in obj_ids if filter_id_func(obj_id)]
+
+        if n_jobs > 1:
+            data_iter = wrappers.process_map(
+                partial(self._get_data_for_available_id, format_table=format_table),
+                obj_ids,
+                n_jobs
+            )
+
+        else:
+            data_iter = (
+                self._get_data_for_available_id(obj_id, format_table=format_table)
+                for obj_id in obj_ids
+            )
+
+        try:
+            for _, data_table in zip(wrappers.build_pbar(obj_ids, verbose), data_iter):
+                if filter_func(data_table):
+                    yield data_table
+
+        finally:
+            data_iter.close()
 
-        iterable = wrappers.build_pbar(self.get_available_ids(), verbose)
-        for obj_id in iterable:
-            data_table = self.get_data_for_id(
-                obj_id, format_table=format_table)
+    def clear_cache(self) -> None:
+        """Clear any cached values so data is re-read from disk
+
+        Caches are cleared automatically when downloading or deleting data.
+        """
 
-            if filter_func(data_table):
-                yield data_table
+        self._ids_cache = None
+        self._tables_cache = None
+        self._loaded_tables = dict()
 
     def delete_module_data(self) -> None:
         """Delete any data for the current survey / data release"""
 
-        try:
-            shutil.rmtree(self._data_dir)
+        for directory in (self._data_dir, self._cache_dir):
+            try:
+                shutil.rmtree(directory)
+
+            except FileNotFoundError:
+                pass
 
-        except FileNotFoundError:
-            pass
+        self.clear_cache()
 
     def download_module_data(self, force: bool = False, timeout: float = 15):
         """Download data for the current survey / data release
@@ -224,6 +338,7 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
                 'This data set does not support downloading remote data')
 
         self._download_module_data(force, timeout)
+        self.clear_cache()
 
 
 # noinspection PyUnresolvedReferences
@@ -246,16 +361,35 @@ class PhotometricRelease(SpectroscopicRelease, metaclass=abc.ABCMeta):
         raise NotImplementedError('Zero points are not defined for this survey')
 
     @classmethod
-    def get_zp_for_band(cls, band: str) -> str:
+    def _get_zp_lookup(cls) -> dict:
+        """Return a dictionary mapping band names to zero points"""
+
+        # Band names and zero points are fixed class attributes, so the
+        # mapping is built once per class. Checking ``cls.__dict__`` keeps
+        # child classes from reusing the mapping of their parent.
+        zp_lookup = cls.__dict__.get('_zp_lookup')
+        if zp_lookup is None:
+            zp_lookup = dict(zip(cls.band_names, map(float, cls.zero_point)))
+            cls._zp_lookup = zp_lookup
+
+        return zp_lookup
+
+    @classmethod
+    def get_zp_for_band(cls, band: Union[str, List[str]]) -> Union[float, np.ndarray]:
         """Get the zeropoint for a given band name
 
         Args:
-            band: The name of the bandpass
+            band: The name of the bandpass or an array of bandpass names
+
+        Returns:
+            The zero point as a float or an array of zero points
         """
 
-        sorter = np.argsort(cls.band_names)
-        indices = np.searchsorted(cls.band_names, band, sorter=sorter)
-        return np.array(cls.zero_point)[sorter[indices]]
+        zp_lookup = cls._get_zp_lookup()
+        if isinstance(band, str):
+            return zp_lookup[band]
+
+        return np.fromiter((zp_lookup[b] for b in band), dtype=float, count=len(band))
 
     def register_filters(self, force: bool = False):
         """Register filters for this survey / data release with SNCosmo
@@ -275,18 +409,26 @@ class DefaultParser:
     """
 
     _table_dir: Path
+    _cache_dir: Path
     _filter_dir: Path
     _filter_file_names: Tuple[str]
     band_names: Tuple[str]
 
+    # Parsed CDS tables are cached on disk if the table file is at least this
+    # many bytes. Smaller tables are parsed faster than a cached copy is read.
+    _table_cache_min_size = 1024 * 1024
+
     def _get_available_tables(self) -> List[VizierTableId]:
         """Default backend functionality of ``get_available_tables`` function"""
 
         # Find available tables - assume standard Vizier naming scheme
         # This includes assuming lowercase file names
         table_nums = []
-        for f in self._table_dir.rglob('table*.dat'):
-            table_number = f.stem.lstrip('table')
+        file_names = data_parsing.list_file_names(
+            self._table_dir, prefix='table', suffix='.dat', recursive=True)
+
+        for file_name in file_names:
+            table_number = file_name[:-len('.dat')].lstrip('table')
             try:
                 table_number = int(table_number)
 
@@ -303,16 +445,45 @@ class DefaultParser:
         readme_path = self._table_dir / 'ReadMe'
         table_path = self._table_dir / f'table{table_id}.dat'
 
+        # Parsing large CDS tables is slow, so reuse a previously parsed copy
+        # if the size and modification time of its source files are unchanged
+        table_stat = table_path.stat()
+        readme_stat = readme_path.stat()
+        source_version = [
+            table_stat.st_size, table_stat.st_mtime_ns,
+            readme_stat.st_size, readme_stat.st_mtime_ns
+        ]
+
+        use_cache = table_stat.st_size >= self._table_cache_min_size
+        # Cached tables are kept outside the data directory, so writing them
+        # does not change the data version used to invalidate other caches
+        cache_path = self._cache_dir / f'table{table_id}.ecsv'
+        if use_cache and cache_path.exists():
+            data = Table.read(str(cache_path), format='ascii.ecsv')
+            if data.meta.pop('source_version', None) == source_version:
+                return data
+
         # Read data from file and add metadata from the readme
         data = ascii.read(str(table_path), format='cds', readme=str(readme_path))
         description = data_parsing.parse_vizier_table_descriptions(readme_path)[table_id]
         data.meta['description'] = description
+
+        if use_cache:
+            data.meta['source_version'] = source_version
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                data.write(str(cache_path), format='ascii.ecsv', overwrite=True)
+
+            except OSError:
+                pass  # The parsed table is still returned if it can't be cached
+
+            finally:
+                del data.meta['source_version']
+
         return data
 
     def _register_filters(self, force: bool = False):
         """Default backend functionality of ``register_filters`` function"""
 
-        bandpass_data = zip(self._filter_file_names, self.band_names)
-        for _file_name, _band_name in bandpass_data:
-            filter_path = self._filter_dir / _file_name
-            data_parsing.register_filter_file(filter_path, _band_name, force=force)
+        filter_paths = [self._filter_dir / file_name for file_name in self._filter_file_names]
+        data_parsing.register_filter_files(filter_paths, self.band_names, force=force)
@@ -3,10 +3,11 @@
 from pathlib import Path
 from typing import List
 
+import pandas as pd
 from astropy.table import Table, vstack
 
 from ..base_classes import DefaultParser, SpectroscopicRelease
-from ..utils import downloads
+from ..utils import data_parsing, downloads
 
 
 def read_csp_spectroscopy_file(path: str, format_table: bool = False) -> Table:
@@ -23,43 +24,52 @@ def read_csp_spectroscopy_file(path: str, format_table: bool = False) -> Table:
     path = Path(path)
     obj_id = '20' + path.name.split('_')[0].lstrip('SN')
 
-    # Handle the single file with a different data model:
-    # This file has three columns instead of two
-    if path.stem == 'SN07bc_070409_b01_BAA_IM':
-        data = Table.read(path, format='ascii', names=['wavelength', 'flux', '_'])
-        data.remove_column('_')
+    # Read the file header. Comment lines are formatted as ``# key: value``
+    file_comments = []
+    with open(path) as ofile:
+        for line in ofile:
+            line = line.strip()
+            if not line.startswith('#'):
+                break
 
-    else:
-        data = Table.read(path, format='ascii', names=['wavelength', 'flux'])
+            file_comments.append(line.lstrip('#').strip())
 
-    # Read the table metadata
-    file_comments = data.meta['comments']
     redshift = float(file_comments[1].lstrip('Redshift: '))
     obs_date = float(file_comments[3].lstrip('JDate_of_observation: '))
     epoch = float(file_comments[4].lstrip('Epoch: '))
 
+    # Read spectral data using the pandas C parser
+    # One file (SN07bc_070409_b01_BAA_IM) has a third column which is dropped
+    spectrum = pd.read_csv(
+        path, sep=r'\s+', comment='#', header=None,
+        names=['wavelength', 'flux'], usecols=[0, 1], engine='c')
+
     # Add meta data to output table according to sndata standard
-    data.meta['obj_id'] = obj_id
-    data.meta['ra'] = None
-    data.meta['dec'] = None
-    data.meta['z'] = redshift
-    data.meta['z_err'] = None
-    del data.meta['comments']
-
-    data['time'] = obs_date
+    meta = {
+        'obj_id': obj_id,
+        'ra': None,
+        'dec': None,
+        'z': redshift,
+        'z_err': None
+    }
+
+    data = Table(
+        {col: spectrum[col].to_numpy() for col in spectrum.columns},
+        meta=meta)
+
     if format_table:
         # Add remaining columns. These values are constant for a single file
-        # (i.e. a single spectrum) but vary across files (across spectra)
+        # (i.e. a single spectrum) but vary across files (across spectra).
+        # Scalars are broadcast by astropy, so no temporary arrays are needed
         _, _, w_range, telescope, instrument = path.stem.split('_')
-        data['epoch'] = epoch
-        data['wavelength_range'] = w_range
-        data['telescope'] = telescope
-        data['instrument'] = instrument
+        data.add_columns(
+            [obs_date, epoch, w_range, telescope, instrument],
+            indexes=[0, 2, 2, 2, 2],
+            names=['time', 'epoch', 'wavelength_range', 'telescope', 'instrument']
+        )
 
-        # Enforce an intuitive column order
-        data = data[[
-            'time', 'wavelength', 'flux', 'epoch',
-            'wavelength_range', 'telescope', 'instrument']]
+    else:
+        data['time'] = obs_date
 
     return data
 
@@ -106,8 +116,8 @@ class DR1(DefaultParser, SpectroscopicRelease):
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        files = self._spectra_dir.glob('SN*.dat')
-        ids = ('20' + Path(f).name.split('_')[0].lstrip('SN') for f in files)
+        files = data_parsing.list_file_names(self._spectra_dir, prefix='SN', suffix='.dat')
+        ids = ('20' + f.split('_')[0].lstrip('SN') for f in files)
         return sorted(set(ids))
 
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -121,11 +131,13 @@ class DR1(DefaultParser, SpectroscopicRelease):
             An astropy table of data for the given ID
         """
 
+        # ``rglob`` returns a generator, so check the parsed tables instead
         files = self._spectra_dir.rglob(f'SN{obj_id[2:]}_*.dat')
-        if not files:
+        tables = [read_csp_spectroscopy_file(path, format_table) for path in files]
+        if not tables:
             raise ValueError(f'No data found for obj_id {obj_id}')
 
-        return vstack([read_csp_spectroscopy_file(path, format_table) for path in files])
+        return vstack(tables)
 
     def _download_module_data(self, force: bool = False, timeout: float = 15):
         """Download data for the current survey / data release
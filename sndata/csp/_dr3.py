@@ -1,13 +1,37 @@
 """This module defines the CSP DR3 API"""
 
 import os
+import re
 from typing import List
 
 import numpy as np
 from astropy.table import Table
 
 from sndata.base_classes import DefaultParser, PhotometricRelease
-from sndata.utils import downloads, unit_conversion
+from sndata.utils import data_parsing, downloads, unit_conversion
+
+# Typos in the DR3 CDS ReadMe as (typo, fix) pairs
+_readme_range_fixes = (
+    ('[0.734/2.256]?', '?=-'),
+    ('[0.036/0.198]?', '?'),
+    ('[-11/66]?', '?=-'),
+    ('[53263.77/54960.03]?', '?=-'),
+    ('[0.06/2.71]?', '?'),
+    ('[53234.7/55165.94]?', '?=-'),
+    ('[0.6/1.24]?', '?'),
+    ('[0.278/1.993]?', '?=-'),
+    ('[0.01/0.175]?', '?'),
+    ('[0.301/1.188]?', '?=-'),
+    ('[0.005/1.761]?', '?'),
+    ('[0.06/1.28]?', '?=-'),
+    ('[0.06/0.067]?', '?')
+)
+
+# Reference descriptions in byte-by-byte lines that are missing a null value
+_readme_reference_typo = re.compile(
+    r'^(\s*\d+(?:-\s*\d+)?\s+[AIFE]\d.*?)(?<!\?=- )((?:Wang|Branch) et al\.)',
+    flags=re.MULTILINE
+)
 
 
 def parse_snoopy_path(path: str):
@@ -20,30 +44,39 @@ def parse_snoopy_path(path: str):
         An astropy table with columns 'time', 'band', 'mag', and 'mag_err'
     """
 
-    out_table = Table(
-        names=['time', 'band', 'mag', 'mag_err'],
-        dtype=[float, object, float, float]
-    )
-
+    # Collect columns as lists and build the table once at the end
+    times, bands, mags, mag_errs = [], [], [], []
     with open(path) as ofile:
         # Get metadata from first line
         name, z, ra, dec = ofile.readline().split()
-        out_table.meta['obj_id'] = name
-        out_table.meta['ra'] = float(ra)
-        out_table.meta['dec'] = float(dec)
-        out_table.meta['z'] = float(z)
-        out_table.meta['z_err'] = None
+        meta = {
+            'obj_id': name,
+            'ra': float(ra),
+            'dec': float(dec),
+            'z': float(z),
+            'z_err': None
+        }
 
         # Read photometric data from the rest of the file
         band = None
-        for line in ofile.readlines():
+        for line in ofile:
             line_list = line.split()
-            if line.startswith('filter'):
+            if line_list[0] == 'filter':
                 band = line_list[1]
                 continue
 
             time, mag, mag_err = line_list
-            out_table.add_row([time, band, mag, mag_err])
+            times.append(float(time))
+            bands.append(band)
+            mags.append(float(mag))
+            mag_errs.append(float(mag_err))
+
+    out_table = Table(
+        [times, bands, mags, mag_errs],
+        names=['time', 'band', 'mag', 'mag_err'],
+        dtype=[float, object, float, float],
+        meta=meta
+    )
 
     out_table['time'] = unit_conversion.convert_to_jd(out_table['time'], format='snpy')
     return out_table
@@ -52,37 +85,26 @@ def parse_snoopy_path(path: str):
 def fix_dr3_readme(readme_path: str):
     """Fix typos in the DR3 CDS Readme so it is machine parsable
 
+    Fixes are matched by content instead of line number and are not
+    re-applied to an already fixed file.
+
     Args:
         readme_path: Path of the README file to fix
     """
 
     os.chmod(readme_path, 438)  # Make sure we can edit the file
-    with open(readme_path, 'r+') as readme:
-        lines = readme.readlines()
-
-        # Mistakes in Table 2
-        lines[148] = lines[148].replace('[0.734/2.256]?', '?=-')
-        lines[150] = lines[150].replace('[0.036/0.198]?', '?')
-        lines[153] = lines[153].replace('Wang et al.', '?=- Wang et al.')
-        lines[155] = lines[155].replace('Branch et al.', '?=- Branch et al.')
-        lines[161] = lines[161].replace('[-11/66]?', '?=-')
-
-        # Mistakes in Table 3
-        lines[186] = lines[186].replace('[53263.77/54960.03]?', '?=-')
-        lines[189] = lines[189].replace('[0.06/2.71]?', '?')
-        lines[190] = lines[190].replace('[53234.7/55165.94]?', '?=-')
-        lines[193] = lines[193].replace('[0.6/1.24]?', '?')
-        lines[194] = lines[194].replace('[0.278/1.993]?', '?=-')
-        lines[195] = lines[195].replace('[0.01/0.175]?', '?')
-        lines[196] = lines[196].replace('[0.734/2.256]?', '?=-')
-        lines[198] = lines[198].replace('[0.036/0.198]?', '?')
-        lines[199] = lines[199].replace('[0.301/1.188]?', '?=-')
-        lines[201] = lines[201].replace('[0.005/1.761]?', '?')
-        lines[202] = lines[202].replace('[0.06/1.28]?', '?=-')
-        lines[204] = lines[204].replace('[0.06/0.067]?', '?')
-
-        readme.seek(0)
-        readme.writelines(lines)
+    with open(readme_path) as readme:
+        text = readme.read()
+
+    # Mistakes in Tables 2 and 3
+    for typo, fix in _readme_range_fixes:
+        text = text.replace(typo, fix)
+
+    # Missing null values for reference columns in Table 2
+    text = _readme_reference_typo.sub(r'\1?=- \2', text)
+
+    with open(readme_path, 'w') as readme:
+        readme.write(text)
 
 
 class DR3(DefaultParser, PhotometricRelease):
@@ -117,6 +139,7 @@ class DR3(DefaultParser, PhotometricRelease):
     )
 
     band_names = tuple(f'csp_dr3_{f}' for f in _band_names)
+    _band_name_map = dict(zip(_band_names, band_names))
     zero_point = (
         12.986, 15.111, 14.902, 14.545, 14.328, 14.437, 14.393,
         14.439, 13.921, 13.836, 13.836, 13.510, 13.770, 13.866, 13.502
@@ -177,8 +200,11 @@ class DR3(DefaultParser, PhotometricRelease):
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        files = self._photometry_dir.glob('*.txt')
-        return sorted(f.stem.split('_')[0].lstrip('SN') for f in files)
+        # File names are formatted as SN<obj_id>_snpy.txt
+        files = data_parsing.list_file_names(self._photometry_dir, prefix='SN', suffix='.txt')
+        ids = [f[2:f.index('_')] for f in files]
+        ids.sort()
+        return ids
 
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
         """Returns data for a given object ID
@@ -192,22 +218,28 @@ class DR3(DefaultParser, PhotometricRelease):
         """
 
         # Read data file for target
-        file_path = self._photometry_dir / f'SN{obj_id}_snpy.txt'
+        file_path = os.path.join(self._photometry_dir, f'SN{obj_id}_snpy.txt')
         data_table = parse_snoopy_path(file_path)
         data_table.meta['obj_id'] = data_table.meta['obj_id'].lstrip('SN')
 
         if format_table:
-            # Convert band names to package standard
-            data_table['band'] = 'csp_dr3_' + data_table['band']
+            # Convert band names to package standard. Iterating over a plain
+            # list is much faster than iterating over a table column.
+            bands = [self._band_name_map[b] for b in data_table['band'].tolist()]
+            data_table['band'] = bands
 
-            offsets = np.array([self._instrument_offsets[b] for b in data_table['band']])
+            offsets = np.array([self._instrument_offsets[b] for b in bands])
             data_table['mag'] += offsets
 
-            # Add flux values
-            data_table['zp'] = self.get_zp_for_band(data_table['band'])
-            data_table['zpsys'] = np.full(len(data_table), 'ab')
-            data_table['flux'] = 10 ** ((data_table['mag'] - data_table['zp']) / -2.5)
-            data_table['fluxerr'] = np.log(10) * data_table['flux'] * data_table['mag_err'] / 2.5
+            # Compute flux values as plain arrays and add them in one call
+            mag = np.asarray(data_table['mag'])
+            mag_err = np.asarray(data_table['mag_err'])
+            zp = self.get_zp_for_band(bands)
+            flux, fluxerr = unit_conversion.mag_to_flux(mag, mag_err, zp)
+            data_table.add_columns(
+                [zp, 'ab', flux, fluxerr],
+                names=['zp', 'zpsys', 'flux', 'fluxerr']
+            )
 
         return data_table
 
@@ -243,10 +275,9 @@ class DR3(DefaultParser, PhotometricRelease):
             timeout=timeout
         )
 
-        for file_name in self._filter_file_names:
-            downloads.download_file(
-                url=self._filter_url + file_name,
-                destination=self._filter_dir / file_name,
-                force=force,
-                timeout=timeout
-            )
+        downloads.download_files(
+            urls=[self._filter_url + file_name for file_name in self._filter_file_names],
+            destinations=[self._filter_dir / file_name for file_name in self._filter_file_names],
+            force=force,
+            timeout=timeout
+        )
@@ -1,15 +1,33 @@
 """This module defines the DES SN3YR API"""
 
+import os
 from typing import List
 from typing import Union
 
 import numpy as np
+from astropy.io import ascii
 from astropy.table import Table
 
 from ..base_classes import DefaultParser, PhotometricRelease
-from ..exceptions import InvalidObjId
 from ..utils import unit_conversion, downloads
 
+# Column names of the SALT2mu fit result (FITRES) tables
+# noinspection SpellCheckingInspection
+_fitres_columns = (
+    'dummy_col', 'CID', 'CIDint', 'IDSURVEY', 'TYPE', 'FIELD', 'CUTFLAG_SNANA',
+    'zHEL', 'zHELERR', 'zCMB', 'zCMBERR', 'zHD', 'zHDERR', 'VPEC', 'VPECERR',
+    'HOST_LOGMASS', 'HOST_LOGMASS_ERR', 'SNRMAX1', 'SNRMAX2', 'SNRMAX3',
+    'PKMJD', 'PKMJDERR', 'x1', 'x1ERR', 'c', 'cERR', 'mB', 'mBERR', 'x0',
+    'x0ERR', 'COV_x1_c', 'COV_x1_x0', 'COV_c_x0', 'NDOF', 'FITCHI2', 'FITPROB',
+    'RA', 'DECL', 'TGAPMAX', 'TrestMIN', 'TrestMAX', 'MWEBV', 'm0obs_i',
+    'm0obs_r', 'em0obs_i', 'em0obs_r', 'MU', 'MUMODEL', 'MUERR', 'MUERR_RAW',
+    'MURES', 'MUPULL', 'M0DIF', 'ERRCODE', 'biasCor_mu', 'biasCorErr_mu',
+    'biasCor_mB', 'biasCor_x1', 'biasCor_c', 'biasScale_muCOV', 'IDSAMPLE'
+)
+
+# Columns of the photometry files used by ``_format_table_to_sncosmo``
+_sncosmo_columns = ('MJD', 'BAND', 'FLUXCAL', 'FLUXCALERR')
+
 
 def _format_table_to_sncosmo(data_table: Table) -> Table:
     """Format a data table for use with SNCosmo
@@ -21,15 +39,21 @@ def _format_table_to_sncosmo(data_table: Table) -> Table:
         The same data in a new table following the SNCosmo data model
     """
 
-    out_table = Table()
-    out_table.meta = data_table.meta
+    # Build the output table from all of its columns at once. The input
+    # table is discarded, so its column data is reused without copying.
+    out_table = Table(
+        {
+            'time': unit_conversion.convert_to_jd(data_table['MJD'], format='MJD'),
+            'band': np.char.add('des_sn3yr_', np.asarray(data_table['BAND'], dtype=str)),
+            'flux': data_table['FLUXCAL'],
+            'fluxerr': data_table['FLUXCALERR']
+        },
+        meta=data_table.meta,
+        copy=False
+    )
 
-    out_table['time'] = unit_conversion.convert_to_jd(data_table['MJD'], format='MJD')
-    out_table['band'] = ['des_sn3yr_' + s for s in data_table['BAND']]
-    out_table['flux'] = data_table['FLUXCAL']
-    out_table['fluxerr'] = data_table['FLUXCALERR']
-    out_table['zp'] = np.full(len(data_table), 27.5)
-    out_table['zpsys'] = np.full(len(data_table), 'ab')
+    # Constant columns are broadcast from scalars by astropy
+    out_table.add_columns([27.5, 'ab'], names=['zp', 'zpsys'])
     return out_table
 
 
@@ -106,40 +130,29 @@ class SN3YR(PhotometricRelease, DefaultParser):
             table_id: The published table number or table name
         """
 
-        if table_id not in self.get_available_tables():
-            raise ValueError(f'Table {table_id} is not available.')
-
-        # noinspection SpellCheckingInspection
-        data = Table.read(
+        # Skip format guessing and use the C based parser explicitly
+        data = ascii.read(
             str(self._fits_dir / table_id),
-            format='ascii',
+            format='no_header',
             data_start=4,
             comment='#',
             exclude_names=['dummy_col'],
-            names=['dummy_col', 'CID', 'CIDint', 'IDSURVEY', 'TYPE', 'FIELD',
-                   'CUTFLAG_SNANA', 'zHEL', 'zHELERR', 'zCMB', 'zCMBERR',
-                   'zHD', 'zHDERR', 'VPEC', 'VPECERR', 'HOST_LOGMASS',
-                   'HOST_LOGMASS_ERR', 'SNRMAX1', 'SNRMAX2', 'SNRMAX3',
-                   'PKMJD',
-                   'PKMJDERR', 'x1', 'x1ERR', 'c', 'cERR', 'mB', 'mBERR', 'x0',
-                   'x0ERR', 'COV_x1_c', 'COV_x1_x0', 'COV_c_x0', 'NDOF',
-                   'FITCHI2', 'FITPROB', 'RA', 'DECL', 'TGAPMAX', 'TrestMIN',
-                   'TrestMAX', 'MWEBV', 'm0obs_i', 'm0obs_r', 'em0obs_i',
-                   'em0obs_r',
-                   'MU', 'MUMODEL', 'MUERR', 'MUERR_RAW', 'MURES', 'MUPULL',
-                   'M0DIF',
-                   'ERRCODE', 'biasCor_mu', 'biasCorErr_mu', 'biasCor_mB',
-                   'biasCor_x1', 'biasCor_c', 'biasScale_muCOV', 'IDSAMPLE'])
+            names=_fitres_columns,
+            guess=False,
+            fast_reader=True)
 
         return data
 
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        # Load list of all target IDs
+        # Load list of all target IDs. File names are formatted as
+        # des_<obj_id>.dat, so the ID is sliced out of each name.
         target_list_path = self._photometry_dir / 'DES-SN3YR_DES.LIST'
-        file_list = np.genfromtxt(target_list_path, dtype=str)
-        return sorted(f.lstrip('des_').rstrip('.dat') for f in file_list)
+        with open(target_list_path) as ofile:
+            file_list = ofile.read().split()
+
+        return sorted(f[4:-4] for f in file_list)
 
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -153,29 +166,39 @@ class SN3YR(PhotometricRelease, DefaultParser):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
-            raise InvalidObjId()
-
         # Read in ascii data table for specified object
-        file_path = self._photometry_dir / f'des_{int(obj_id):08d}.dat'
+        file_path = os.path.join(self._photometry_dir, f'des_{int(obj_id):08d}.dat')
 
+        with open(file_path) as ofile:
+            file_contents = ofile.read()
+
+        # The file format is known ahead of time, so skip format guessing and
+        # use the C based parser. The trailing ``END:`` line is dropped up
+        # front since the fast parser tokenizes every line before ``data_end``
+        # is applied.
+        # Formatted tables only need a subset of the columns, so the
+        # remaining columns are not converted at all in that case.
         # noinspection SpellCheckingInspection
-        data = Table.read(
-            file_path, format='ascii',
-            data_start=27, data_end=-1,
+        data = ascii.read(
+            file_contents.rstrip().rsplit('\n', 1)[0],
+            format='no_header', data_start=27, guess=False, fast_reader=True,
             names=['VARLIST:', 'MJD', 'BAND', 'FIELD', 'FLUXCAL', 'FLUXCALERR',
-                   'ZPFLUX', 'PSF', 'SKYSIG', 'GAIN', 'PHOTFLAG', 'PHOTPROB'])
-
-        # Add meta data to table
-        with open(file_path) as ofile:
-            table_meta_data = ofile.readlines()
-            data.meta['obj_id'] = obj_id
-            data.meta['ra'] = float(table_meta_data[7].split()[1])
-            data.meta['dec'] = float(table_meta_data[8].split()[1])
-            data.meta['z'] = float(table_meta_data[13].split()[1])
-            data.meta['z_err'] = float(table_meta_data[13].split()[3])
-            data.meta['dtype'] = 'photometric'
-            del data.meta['comments']
+                   'ZPFLUX', 'PSF', 'SKYSIG', 'GAIN', 'PHOTFLAG', 'PHOTPROB'],
+            include_names=_sncosmo_columns if format_table else None)
+
+        # Add meta data to table using only the header lines of the file.
+        # Comments collected by the reader are not needed, so the metadata
+        # is replaced outright instead of deleting them afterwards.
+        table_meta_data = file_contents.split('\n', 14)[:14]
+        redshift_line = table_meta_data[13].split()
+        data.meta = {
+            'obj_id': obj_id,
+            'ra': float(table_meta_data[7].split()[1]),
+            'dec': float(table_meta_data[8].split()[1]),
+            'z': float(redshift_line[1]),
+            'z_err': float(redshift_line[3]),
+            'dtype': 'photometric'
+        }
 
         if format_table:
             data = _format_table_to_sncosmo(data)
@@ -1,14 +1,13 @@
 """This module defines the Essence Narayan16 API"""
 
-from pathlib import Path
 from typing import List
 
 import numpy as np
+from astropy.io import ascii
 from astropy.table import Table
 
 from ..base_classes import DefaultParser, PhotometricRelease
-from ..exceptions import InvalidObjId
-from ..utils import downloads, unit_conversion
+from ..utils import data_parsing, downloads, unit_conversion
 
 
 def _format_table_to_sncosmo(data_table: Table) -> Table:
@@ -21,17 +20,20 @@ def _format_table_to_sncosmo(data_table: Table) -> Table:
         The same data in a new table following the SNCosmo data model
     """
 
-    out_table = Table()
-    out_table.meta = data_table.meta
-
-    out_table['time'] = unit_conversion.convert_to_jd(data_table['MJD'], format='MJD')
-    out_table['band'] = ['csp_dr3_' + band for band in data_table['Passband']]
-    out_table['zp'] = np.full(len(data_table), 25)
-    out_table['zpsys'] = np.full(len(data_table), 'ab')
-    out_table['flux'] = data_table['Flux']
-    out_table['fluxerr'] = np.max(
-        [data_table['Fluxerr_hi'], data_table['Fluxerr_lo']], axis=0)
-
+    # Reuse the parsed column data instead of copying it
+    out_table = Table(
+        {
+            'time': unit_conversion.convert_to_jd(data_table['MJD'], format='MJD'),
+            'band': np.char.add('csp_dr3_', np.asarray(data_table['Passband'], dtype=str)),
+            'flux': data_table['Flux'],
+            'fluxerr': np.maximum(
+                np.asarray(data_table['Fluxerr_hi']), np.asarray(data_table['Fluxerr_lo']))
+        },
+        meta=data_table.meta,
+        copy=False
+    )
+
+    out_table.add_columns([25, 'ab'], indexes=[2, 2], names=['zp', 'zpsys'])
     return out_table
 
 
@@ -79,12 +81,44 @@ class Narayan16(DefaultParser, PhotometricRelease):
         )
 
         self._filter_file_names = ('R_band.dat', 'I_band.dat')
+        self._metadata_cache = None
 
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        files = self._photometry_dir.glob('*.dat')
-        return sorted(Path(f).name.split('.')[0] for f in files)
+        files = data_parsing.list_file_names(self._photometry_dir, suffix='.dat')
+        return sorted(f.split('.')[0] for f in files)
+
+    def _get_object_metadata(self, obj_id: str):
+        """Return the row of table 6 for a given object ID
+
+        Table 6 is indexed by object ID the first time it is needed, so later
+        lookups don't copy and scan the full table.
+
+        Args:
+            obj_id: The ID of the desired object
+
+        Returns:
+            A row of table 6 or ``None`` if ``obj_id`` is not listed
+        """
+
+        if self._metadata_cache is None:
+            metadata_lookup = dict()
+            for row in self.load_table(6):
+                metadata_lookup.setdefault(row['ESSENCE'], row)
+
+            self._metadata_cache = metadata_lookup
+
+        return self._metadata_cache.get(obj_id)
+
+    def clear_cache(self) -> None:
+        """Clear any cached values so data is re-read from disk
+
+        Caches are cleared automatically when downloading or deleting data.
+        """
+
+        super().clear_cache()
+        self._metadata_cache = None
 
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -98,19 +132,17 @@ class Narayan16(DefaultParser, PhotometricRelease):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
-            raise InvalidObjId()
-
-        # Get photometric data
+        # Get photometric data. The column layout is fixed and any header
+        # lines are commented out, so skip format guessing and use the C
+        # based parser.
         path = self._photometry_dir / f'{obj_id}.W6yr.clean.nn2.Wstd.dat'
-        data_table = Table.read(
-            path, format='ascii',
+        data_table = ascii.read(
+            str(path), format='no_header', guess=False, fast_reader=True,
             names=['Observation', 'MJD', 'Passband', 'Flux', 'Fluxerr_lo', 'Fluxerr_hi']
         )
 
         # Get meta data
-        table_6 = self.load_table(6)
-        object_metadata = table_6[table_6['ESSENCE'] == obj_id][0]
+        object_metadata = self._get_object_metadata(obj_id)
         ra, dec = unit_conversion.hourangle_to_degrees(
             rah=object_metadata['RAh'],
             ram=object_metadata['RAm'],
@@ -150,10 +182,9 @@ class Narayan16(DefaultParser, PhotometricRelease):
             timeout=timeout
         )
 
-        for filter_file, filter_url in zip(self._filter_file_names, self._filter_urls):
-            downloads.download_file(
-                url=filter_url,
-                destination=self._filter_dir / filter_file,
-                force=force,
-                timeout=timeout
-            )
+        downloads.download_files(
+            urls=self._filter_urls,
+            destinations=[self._filter_dir / file_name for file_name in self._filter_file_names],
+            force=force,
+            timeout=timeout
+        )
@@ -8,7 +8,6 @@ from astropy.io import ascii, fits
 from astropy.table import Table
 
 from ..base_classes import PhotometricRelease
-from ..exceptions import InvalidObjId
 from ..utils import downloads, data_parsing, unit_conversion
 
 
@@ -166,10 +165,10 @@ class Betoule14(PhotometricRelease):
     def _get_available_tables(self) -> List[str]:
         """Get Ids for available vizier tables published by this data release"""
 
-        dat_file_list = list(self._table_dir.glob('table*.dat'))
-        fits_file_list = list(self._table_dir.glob('table*.fit'))
+        dat_file_list = data_parsing.list_file_names(self._table_dir, prefix='table', suffix='.dat')
+        fits_file_list = data_parsing.list_file_names(self._table_dir, prefix='table', suffix='.fit')
         file_list = dat_file_list + fits_file_list
-        return sorted([str(f).rstrip('.datfit')[-2:] for f in file_list])
+        return sorted([f.rstrip('.datfit')[-2:] for f in file_list])
 
     def _load_table(self, table_id: str) -> Table:
         """Return a Vizier table published by this data release
@@ -178,9 +177,6 @@ class Betoule14(PhotometricRelease):
             table_id: The published table number or table name
         """
 
-        if table_id not in self.get_available_tables():
-            raise ValueError(f'Table {table_id} is not available.')
-
         # Tables 2 is a fits file
         if table_id == 'f2':
             with fits.open(self._table_dir / f'table{table_id}.fit') as hdulist:
@@ -201,8 +197,8 @@ class Betoule14(PhotometricRelease):
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        file_list = self._photometry_dir.glob('*.list')
-        return sorted(str(f).split('-')[-1][:-5] for f in file_list)
+        file_list = data_parsing.list_file_names(self._photometry_dir, suffix='.list')
+        return sorted(f.split('-')[-1][:-5] for f in file_list)
 
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -216,9 +212,6 @@ class Betoule14(PhotometricRelease):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
-            raise InvalidObjId()
-
         # Get target meta data
         meta_data = dict()
         path = self._photometry_dir / f'lc-{obj_id}.list'
@@ -248,8 +241,8 @@ class Betoule14(PhotometricRelease):
             out_table.rename_column('MagSys', 'zpsys')
 
             out_table['time'] = unit_conversion.convert_to_jd(out_table['time'], format='snpy')
-            out_table['band'] = ['jla_betoule14_' + b for b in
-                                 out_table['band']]
+            out_table['band'] = np.char.add(
+                'jla_betoule14_', np.asarray(out_table['band'], dtype=str))
 
         # Add package standard metadata
         ra = meta_data.pop('RA', None)
@@ -186,19 +186,20 @@ class Ganeshalingam13(DefaultParser, PhotometricRelease):
         object_data = photometry[photometry['SN'] == obj_id]
 
         if format_table:
-            zp_dict = dict(zip(self.band_names, self.zero_point))
-            bands, zp = [], []
-            for row in object_data:
-                band = f'loss_ganeshalingam13_{row["Filter"]}_{row["Telescope System"].lower()}'
-                bands.append(band)
-                zp.append(zp_dict[band])
-
-            object_data['time'] = unit_conversion.convert_to_jd(object_data['MJD'], 'mjd')
-            object_data['band'] = bands
-            object_data['zp'] = zp
-            object_data['flux'] = 10 ** ((object_data['Mag'] - object_data['zp']) / -2.5)
-            object_data['fluxerr'] = (np.log(10) / -2.5) * object_data['flux'] * object_data['Mag err']
-            object_data['zpsys'] = 'AB'
+            bands = [
+                f'loss_ganeshalingam13_{filter_name}_{system.lower()}'
+                for filter_name, system in zip(object_data['Filter'], object_data['Telescope System'])
+            ]
+
+            # Compute flux values as plain arrays and add them in one call
+            time = unit_conversion.convert_to_jd(object_data['MJD'], 'mjd')
+            zp = self.get_zp_for_band(bands)
+            flux, fluxerr = unit_conversion.mag_to_flux(
+                np.asarray(object_data['Mag']), np.asarray(object_data['Mag err']), zp)
+            object_data.add_columns(
+                [time, bands, zp, flux, fluxerr, 'AB'],
+                names=['time', 'band', 'zp', 'flux', 'fluxerr', 'zpsys']
+            )
             object_data.remove_columns(['SN', 'MJD', 'Filter', 'Mag', 'Mag err'])
 
         meta = load_meta()
@@ -215,15 +216,12 @@ class Ganeshalingam13(DefaultParser, PhotometricRelease):
             timeout: Seconds before timeout for individual files/archives
         """
 
-        urls = (self._table_3_url, self._photometry_url)
-        paths = (self._table_3_path, self._photometry_path)
-        for file_url, file_path in zip(urls, paths):
-            downloads.download_file(
-                url=file_url,
-                destination=file_path,
-                force=force,
-                timeout=timeout
-            )
+        downloads.download_files(
+            urls=(self._table_3_url, self._photometry_url),
+            destinations=(self._table_3_path, self._photometry_path),
+            force=force,
+            timeout=timeout
+        )
 
         downloads.download_tar(
             url=self._filter_url,
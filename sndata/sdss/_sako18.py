@@ -6,26 +6,29 @@ from typing import List, Union
 from urllib.parse import urljoin
 
 import numpy as np
-from astropy.table import Column, Table
+from astropy.table import Table
 
 from ..base_classes import DefaultParser, PhotometricRelease
-from ..exceptions import InvalidObjId
-from ..utils import downloads, unit_conversion
+from ..utils import data_parsing, downloads, unit_conversion
 
 
-@np.vectorize
-def _construct_band_name(filter_id: int, ccd_id: int) -> str:
-    """Return the sncosmo band name given filter and CCD ID
+# Band names indexed by filter ID (0 through 4 for 'ugriz') and CCD ID
+_band_name_lookup = np.array(
+    [[f'sdss_sako18_{f}{c}' for c in range(7)] for f in 'ugriz'])
 
-    Args:
-        filter_id: Filter index 1 through 5 for 'ugriz'
-        ccd_id: Column number 1 through 6
+
+def _construct_band_name(filter_id: np.ndarray, ccd_id: np.ndarray) -> np.ndarray:
+    """Return the sncosmo band names given filter and CCD IDs
 
     Args:
-        The name of the filter registered with sncosmo
+        filter_id: Filter indices 0 through 4 for 'ugriz'
+        ccd_id: Column numbers 1 through 6
+
+    Returns:
+        An array of filter names registered with sncosmo
     """
 
-    return f'sdss_sako18_{"ugriz"[filter_id]}{ccd_id}'
+    return _band_name_lookup[filter_id, ccd_id]
 
 
 def _format_table_to_sncosmo(data_table: Table) -> Table:
@@ -43,18 +46,24 @@ def _format_table_to_sncosmo(data_table: Table) -> Table:
         return Table(
             names=['time', 'band', 'zp', 'flux', 'fluxerr', 'zpsys', 'flag'])
 
-    out_table = Table()
-    out_table.meta = data_table.meta
-
-    out_table['time'] = data_table['JD']
-    out_table['band'] = _construct_band_name(
-        data_table['FILT'], data_table['IDCCD'])
-
-    out_table['zp'] = np.full(len(data_table), 2.5 * np.log10(3631))
-    out_table['flux'] = data_table['FLUX'] * 1E-6
-    out_table['fluxerr'] = data_table['FLUXERR'] * 1E-6
-    out_table['zpsys'] = np.full(len(data_table), 'ab')
-    out_table['flag'] = data_table['FLAG']
+    # Build the output table from all of its columns at once
+    out_table = Table(
+        {
+            'time': data_table['JD'],
+            'band': _construct_band_name(data_table['FILT'], data_table['IDCCD']),
+            'flux': data_table['FLUX'] * 1E-6,
+            'fluxerr': data_table['FLUXERR'] * 1E-6,
+            'flag': data_table['FLAG']
+        },
+        meta=data_table.meta
+    )
+
+    # Constant columns are broadcast from scalars by astropy
+    out_table.add_columns(
+        [2.5 * np.log10(3631), 'ab'],
+        indexes=[2, 4],
+        names=['zp', 'zpsys']
+    )
 
     return out_table
 
@@ -107,6 +116,8 @@ class Sako18(PhotometricRelease, DefaultParser):
         self._smp_dir = self._data_dir / 'SMP_Data/'  # SMP data files (photometric light-curves)
         self._snana_dir = self._data_dir / 'SDSS_dataRelease-snana/'  # SNANA files including list of outliers
         self._outlier_path = self._snana_dir / 'SDSS_allCandidates+BOSS/SDSS_allCandidates+BOSS.IGNORE'  # Outlier data
+        self._outliers_cache = None
+        self._master_cache = None
 
         self._filter_file_names = tuple(f'{b}{c}.dat' for b, c in product('ugriz', '123456'))
         self._table_names = 'master_data.txt', 'Table2.txt', 'Table9.txt', 'Table11.txt', 'Table12.txt'
@@ -122,8 +133,8 @@ class Sako18(PhotometricRelease, DefaultParser):
         """Get Ids for available vizier tables published by this data release"""
 
         table_names = []
-        for f in self._table_dir.glob('*.txt'):
-            table_num = f.stem.strip('Table_data')
+        for file_name in data_parsing.list_file_names(self._table_dir, suffix='.txt'):
+            table_num = file_name[:-len('.txt')].strip('Table_data')
             if table_num.isnumeric():
                 table_num = int(table_num)
 
@@ -138,21 +149,19 @@ class Sako18(PhotometricRelease, DefaultParser):
             table_id: The published table number or table name
         """
 
-        if table_id not in self.get_available_tables():
-            raise ValueError(f'Table {table_id} is not available.')
-
         if table_id == 'master':
-            table = Table.read(self._table_dir / 'master_data.txt', format='ascii')
+            table_path = self._table_dir / 'master_data.txt'
 
         else:
-            table = Table.read(
-                self._table_dir / f'Table{table_id}.txt', format='ascii')
+            table_path = self._table_dir / f'Table{table_id}.txt'
 
-        table['CID'] = Column(table['CID'], dtype=str)
+        # Parse ID columns directly as strings instead of re-typing them
+        # after reading. Only table 9 includes spectroscopic IDs.
+        converters = {'CID': str}
         if table_id == 9:
-            table['SID'] = Column(table['SID'], dtype=str)
+            converters['SID'] = str
 
-        return table
+        return Table.read(table_path, format='ascii', converters=converters)
 
     def _get_available_ids(self):
         """Return a list of target object IDs for the current survey
@@ -163,6 +172,53 @@ class Sako18(PhotometricRelease, DefaultParser):
 
         return sorted(self.load_table('master')['CID'])
 
+    def _get_master_record(self, obj_id: str):
+        """Return the row of the master table for a given object ID
+
+        The master table is indexed by object ID the first time it is
+        needed, so later lookups don't scan the full table.
+
+        Args:
+            obj_id: The ID of the desired object
+
+        Returns:
+            A row of the master table or ``None`` if ``obj_id`` is not listed
+        """
+
+        if self._master_cache is None:
+            master_lookup = dict()
+            for row in self.load_table('master'):
+                master_lookup.setdefault(row['CID'], row)
+
+            self._master_cache = master_lookup
+
+        return self._master_cache.get(obj_id)
+
+    def _load_outliers(self) -> dict:
+        """Return outliers from the SDSS IGNORE file, reading it only once
+
+        The returned dictionary is cached and should not be modified.
+
+        Returns:
+            A dictionary {<obj_id>: [<MJD of bad data point>, ...], ...}
+        """
+
+        if self._outliers_cache is None:
+            out_dict = dict()
+            with open(self._outlier_path) as ofile:
+                for line in ofile:
+                    if line.startswith('IGNORE:'):
+                        line_list = line.split()
+                        cid, mjd, band = line_list[1], line_list[2], line_list[3]
+                        if cid not in out_dict:
+                            out_dict[str(cid)] = []
+
+                        out_dict[str(cid)].append(mjd)
+
+            self._outliers_cache = out_dict
+
+        return self._outliers_cache
+
     def get_outliers(self) -> dict:
         """Return a dictionary of data points marked by SDSS II as outliers
 
@@ -170,18 +226,17 @@ class Sako18(PhotometricRelease, DefaultParser):
             A dictionary {<obj_id>: [<MJD of bad data point>, ...], ...}
         """
 
-        out_dict = dict()
-        with open(self._outlier_path) as ofile:
-            for line in ofile.readlines():
-                if line.startswith('IGNORE:'):
-                    line_list = line.split()
-                    cid, mjd, band = line_list[1], line_list[2], line_list[3]
-                    if cid not in out_dict:
-                        out_dict[str(cid)] = []
+        return {cid: list(mjds) for cid, mjds in self._load_outliers().items()}
 
-                    out_dict[str(cid)].append(mjd)
+    def clear_cache(self) -> None:
+        """Clear any cached values so data is re-read from disk
 
-        return out_dict
+        Caches are cleared automatically when downloading or deleting data.
+        """
+
+        super().clear_cache()
+        self._outliers_cache = None
+        self._master_cache = None
 
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -195,10 +250,7 @@ class Sako18(PhotometricRelease, DefaultParser):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
-            raise InvalidObjId()
-
-            # Read in ascii data table for specified object
+        # Read in ascii data table for specified object
         file_path = self._smp_dir / f'SMP_{int(obj_id):06d}.dat'
         data = Table.read(file_path, format='ascii')
 
@@ -210,18 +262,17 @@ class Sako18(PhotometricRelease, DefaultParser):
         data['JD'] = unit_conversion.convert_to_jd(data['MJD'], format='mjd')
 
         # Add meta data
-        master_table = self.load_table('master')
-        table_meta_data = master_table[master_table['CID'] == obj_id]
+        table_meta_data = self._get_master_record(obj_id)
         data.meta['obj_id'] = obj_id
-        data.meta['ra'] = table_meta_data['RA'][0]
-        data.meta['dec'] = table_meta_data['DEC'][0]
-        data.meta['z'] = table_meta_data['zCMB'][0]
-        data.meta['z_err'] = table_meta_data['zerrCMB'][0]
+        data.meta['ra'] = table_meta_data['RA']
+        data.meta['dec'] = table_meta_data['DEC']
+        data.meta['z'] = table_meta_data['zCMB']
+        data.meta['z_err'] = table_meta_data['zerrCMB']
         data.meta['dtype'] = 'photometric'
-        data.meta['classification'] = table_meta_data['Classification'][0]
+        data.meta['classification'] = table_meta_data['Classification']
         del data.meta['comments']
 
-        outlier_list = self.get_outliers().get(obj_id, [])
+        outlier_list = self._load_outliers().get(obj_id, [])
         if outlier_list:
             keep_indices = ~np.isin(data['MJD'], outlier_list)
             data = data[keep_indices]
@@ -259,24 +310,22 @@ class Sako18(PhotometricRelease, DefaultParser):
             timeout=timeout
         )
 
-        # Unzip file listing "bad" photometry
+        # Unzip file listing "bad" photometry unless it was already extracted
         outlier_archive = self._snana_dir / 'SDSS_allCandidates+BOSS.tar.gz'
-        if outlier_archive.exists():
+        if outlier_archive.exists() and (force or not self._outlier_path.exists()):
             with tarfile.open(str(outlier_archive), mode='r:gz') as data:
                 data.extractall(str(outlier_archive.parent))
 
-        for file_name in self._table_names:
-            downloads.download_file(
-                url=self._base_url + file_name,
-                destination=self._table_dir / file_name,
-                force=force,
-                timeout=timeout
-            )
-
-        for file_name in self._filter_file_names:
-            downloads.download_file(
-                url=self._filter_url + file_name,
-                destination=self._filter_dir / file_name,
-                force=force,
-                timeout=timeout
-            )
+        downloads.download_files(
+            urls=[self._base_url + file_name for file_name in self._table_names],
+            destinations=[self._table_dir / file_name for file_name in self._table_names],
+            force=force,
+            timeout=timeout
+        )
+
+        downloads.download_files(
+            urls=[self._filter_url + file_name for file_name in self._filter_file_names],
+            destinations=[self._filter_dir / file_name for file_name in self._filter_file_names],
+            force=force,
+            timeout=timeout
+        )
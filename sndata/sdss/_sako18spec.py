@@ -6,10 +6,11 @@ from pathlib import Path
 from typing import List, Union
 from urllib.parse import urljoin
 
-from astropy.table import Column, Table, vstack
+from astropy.io import ascii
+from astropy.table import Table, vstack
 
 from ..base_classes import SpectroscopicRelease
-from ..utils import downloads
+from ..utils import data_parsing, downloads
 
 
 class Sako18Spec(SpectroscopicRelease):
@@ -53,6 +54,9 @@ class Sako18Spec(SpectroscopicRelease):
         self._spectra_dir = self._data_dir / 'Spectra_txt'  # spectra files
         self._spectra_zip = Path(__file__).parent / 'Spectra_txt.zip'  # compressed spectra files
         self._table_names = 'master_data.txt', 'Table2.txt', 'Table9.txt', 'Table11.txt', 'Table12.txt'
+        self._master_cache = None
+        self._spectra_cache = None
+        self._spectra_files_cache = None
 
         # Define urls and file names for remote data
         self._base_url = 'https://portal.nersc.gov/project/dessn/SDSS/dataRelease/'
@@ -62,8 +66,8 @@ class Sako18Spec(SpectroscopicRelease):
         """Get Ids for available vizier tables published by this data release"""
 
         table_names = []
-        for f in self._table_dir.glob('*.txt'):
-            table_num = f.stem.strip('Table_data')
+        for file_name in data_parsing.list_file_names(self._table_dir, suffix='.txt'):
+            table_num = file_name[:-len('.txt')].strip('Table_data')
             if table_num.isnumeric():
                 table_num = int(table_num)
 
@@ -78,27 +82,110 @@ class Sako18Spec(SpectroscopicRelease):
             table_id: The published table number or table name
         """
 
-        if table_id not in self.get_available_tables():
-            raise ValueError(f'Table {table_id} is not available.')
-
         if table_id == 'master':
-            table = Table.read(self._table_dir / 'master_data.txt', format='ascii')
+            table_path = self._table_dir / 'master_data.txt'
 
         else:
-            table = Table.read(
-                self._table_dir / f'Table{table_id}.txt', format='ascii')
+            table_path = self._table_dir / f'Table{table_id}.txt'
 
-        table['CID'] = Column(table['CID'], dtype=str)
+        # Parse ID columns directly as strings instead of re-typing them
+        # after reading. Only table 9 includes spectroscopic IDs.
+        converters = {'CID': str}
         if table_id == 9:
-            table['SID'] = Column(table['SID'], dtype=str)
+            converters['SID'] = str
 
-        return table
+        return Table.read(table_path, format='ascii', converters=converters)
 
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
         return sorted(set(self.load_table(9)['CID']))
 
+    def _get_master_record(self, obj_id: str):
+        """Return the row of the master table for a given object ID
+
+        The master table is indexed by object ID the first time it is
+        needed, so later lookups don't scan the full table.
+
+        Args:
+            obj_id: The ID of the desired object
+
+        Returns:
+            A row of the master table or ``None`` if ``obj_id`` is not listed
+        """
+
+        if self._master_cache is None:
+            master_lookup = dict()
+            for row in self.load_table('master'):
+                master_lookup.setdefault(row['CID'], row)
+
+            self._master_cache = master_lookup
+
+        return self._master_cache.get(obj_id)
+
+    def _get_spectrum_record(self, spec_id: str):
+        """Return the row of the spectra summary table for a given spectrum ID
+
+        Table 9 is indexed by spectrum ID the first time it is needed, so
+        later lookups don't copy and scan the full table.
+
+        Args:
+            spec_id: The ID of the desired spectrum
+
+        Returns:
+            A row of table 9 or ``None`` if ``spec_id`` is not listed
+        """
+
+        if self._spectra_cache is None:
+            spectra_lookup = dict()
+            for row in self.load_table(9):
+                spectra_lookup.setdefault(row['SID'], row)
+
+            self._spectra_cache = spectra_lookup
+
+        return self._spectra_cache.get(spec_id)
+
+    def _get_spectra_paths(self, obj_id: str) -> List[Path]:
+        """Return the paths of all spectra files for a given object ID
+
+        Spectra files are named ``<sn or gal><obj_id>-<spec_id>.txt``. The
+        spectra directory is scanned once and the file names are grouped by
+        prefix, so later lookups don't list the full directory again.
+
+        Args:
+            obj_id: The ID of the desired object
+
+        Returns:
+            Paths of supernova spectra followed by paths of galaxy spectra
+        """
+
+        if self._spectra_files_cache is None:
+            files_lookup = dict()
+            for file_name in data_parsing.list_file_names(self._spectra_dir, suffix='.txt'):
+                prefix, sep, _ = file_name.partition('-')
+                if sep:
+                    files_lookup.setdefault(prefix, []).append(file_name)
+
+            self._spectra_files_cache = files_lookup
+
+        file_names = (
+            self._spectra_files_cache.get(f'sn{obj_id}', []) +
+            self._spectra_files_cache.get(f'gal{obj_id}', [])
+        )
+
+        return [self._spectra_dir / file_name for file_name in file_names]
+
+    def clear_cache(self) -> None:
+        """Clear any cached values so data is re-read from disk
+
+        Caches are cleared automatically when downloading or deleting data.
+        """
+
+        super().clear_cache()
+        self._master_cache = None
+        self._spectra_cache = None
+        self._spectra_files_cache = None
+
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
         """Returns data for a given object ID
@@ -113,16 +200,22 @@ class Sako18Spec(SpectroscopicRelease):
 
         # Read in all spectra for the given object ID
         data_tables = []
-        files = list(self._spectra_dir.glob(f'sn{obj_id}-*.txt'))
-        files += list(self._spectra_dir.glob(f'gal{obj_id}-*.txt'))
-        for path in files:
-            data = Table.read(path, format='ascii', names=['wavelength', 'flux'])
+        for path in self._get_spectra_paths(obj_id):
+            # Spectra files have no header, so skip format guessing and
+            # use the compiled fast reader
+            data = ascii.read(
+                str(path),
+                names=['wavelength', 'flux'],
+                format='no_header',
+                guess=False,
+                fast_reader=True
+            )
+
             extraction_type = path.stem.split('-')[0].strip(obj_id)
             spec_id = path.stem.split('-')[-1]
 
             # Get type of object observed by spectra
-            spectra_summary = self.load_table(9)
-            summary_row = spectra_summary[spectra_summary['SID'] == spec_id][0]
+            summary_row = self._get_spectrum_record(spec_id)
             spec_type = 'Gal' if extraction_type == 'gal' else summary_row['Type']
 
             # Get metadata for the current spectrum from the summary table
@@ -150,14 +243,13 @@ class Sako18Spec(SpectroscopicRelease):
         out_data.meta['obj_id'] = obj_id
 
         # Add metadata from the master table
-        master_table = self.load_table('master')
-        phot_record = master_table[master_table['CID'] == obj_id]
+        phot_record = self._get_master_record(obj_id)
 
-        if phot_record:
-            out_data.meta['ra'] = phot_record['RA'][0]
-            out_data.meta['dec'] = phot_record['DEC'][0]
-            out_data.meta['z'] = phot_record['zCMB'][0]
-            out_data.meta['z_err'] = phot_record['zerrCMB'][0]
+        if phot_record is not None:
+            out_data.meta['ra'] = phot_record['RA']
+            out_data.meta['dec'] = phot_record['DEC']
+            out_data.meta['z'] = phot_record['zCMB']
+            out_data.meta['z_err'] = phot_record['zerrCMB']
 
         else:
             # Known cases include the following object ids:
@@ -178,13 +270,12 @@ class Sako18Spec(SpectroscopicRelease):
             timeout: Seconds before timeout for individual files/archives
         """
 
-        for file_name in self._table_names:
-            downloads.download_file(
-                url=self._base_url + file_name,
-                destination=self._table_dir / file_name,
-                force=force,
-                timeout=timeout
-            )
+        downloads.download_files(
+            urls=[self._base_url + file_name for file_name in self._table_names],
+            destinations=[self._table_dir / file_name for file_name in self._table_names],
+            force=force,
+            timeout=timeout
+        )
 
         # Spectral data parsing requires IRAF, so we use preparsed data instead
         if force or not self._spectra_dir.exists():
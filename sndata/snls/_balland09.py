@@ -1,13 +1,11 @@
 """This module defines the SNLS Balland09 API"""
 
 import os
-from pathlib import Path
 
 from astropy.table import Table, vstack
 
 from ..base_classes import DefaultParser, SpectroscopicRelease
-from ..exceptions import InvalidObjId
-from ..utils import downloads, unit_conversion
+from ..utils import data_parsing, downloads, unit_conversion
 
 
 def fix_balland09_cds_readme(readme_path):
@@ -67,10 +65,9 @@ class Balland09(DefaultParser, SpectroscopicRelease):
     def _get_available_ids(self):
         """Return a list of target object IDs for the current survey"""
 
-        # Use recursive glob since the data files are in subdirectories
-        files = self._spectra_dir.rglob('*.dat')
-        ids = (Path(f).name.split('_')[1] for f in files)
-        return sorted(set(ids))
+        # Search recursively since the data files are in subdirectories
+        files = data_parsing.list_file_names(self._spectra_dir, suffix='.dat', recursive=True)
+        return sorted({f.split('_')[1] for f in files})
 
     # noinspection PyUnusedLocal
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
@@ -84,9 +81,6 @@ class Balland09(DefaultParser, SpectroscopicRelease):
             An astropy table of data for the given ID
         """
 
-        if obj_id not in self.get_available_ids():
-            raise InvalidObjId()
-
         tables = []
         for fpath in self._spectra_dir.rglob(f'*_{obj_id}_*_Balland_etal_09.dat'):
             data_table = Table.read(
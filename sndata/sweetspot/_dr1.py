@@ -7,7 +7,7 @@ from typing import List
 from astropy.table import Table
 
 from ..base_classes import PhotometricRelease, DefaultParser
-from ..utils import downloads, unit_conversion
+from ..utils import data_parsing, downloads, unit_conversion
 
 _dr1_files = [
     'CSS121009:011101-172841_CSS121009:011101-172841.Wstd.dat',
@@ -110,11 +110,8 @@ class DR1(PhotometricRelease, DefaultParser):
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        obj_ids = set()
-        for file in self._photometry_dir.glob('*.Wstd.dat'):
-            obj_ids.add(file.stem.split('_')[0])
-
-        return sorted(obj_ids)
+        files = data_parsing.list_file_names(self._photometry_dir, suffix='.Wstd.dat')
+        return sorted({f[:-len('.dat')].split('_', 1)[0] for f in files})
 
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
         """Returns data for a given object ID
@@ -191,15 +188,12 @@ class DR1(PhotometricRelease, DefaultParser):
             timeout=timeout
         )
 
-        for file_name in _dr1_files:
-            file_url = self._photometry_url + file_name
-
-            downloads.download_file(
-                url=file_url,
-                destination=self._photometry_dir / file_name,
-                force=force,
-                timeout=timeout,
-                verbose=False
-            )
+        downloads.download_files(
+            urls=[self._photometry_url + file_name for file_name in _dr1_files],
+            destinations=[self._photometry_dir / file_name for file_name in _dr1_files],
+            force=force,
+            timeout=timeout,
+            verbose=False
+        )
 
         self._decompress_filters()
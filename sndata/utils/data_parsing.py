@@ -4,8 +4,10 @@ responsible for locating and registering data located on the local machine.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Iterable, List, Tuple, Union
 
 import numpy as np
 import sncosmo
@@ -25,6 +27,20 @@ def require_data_path(*data_dirs: Path):
             raise NoDownloadedData()
 
 
+def _find_base_dir() -> Path:
+    """Return the root directory used to store downloaded data and caches
+
+    Returns:
+        The ``SNDATA_DIR`` environmental variable if set, otherwise the
+        ``data`` directory of the installed package
+    """
+
+    if 'SNDATA_DIR' in os.environ:
+        return Path(os.environ['SNDATA_DIR']).resolve()
+
+    return Path(__file__).resolve().parent.parent / 'data'
+
+
 def find_data_dir(survey_abbrev: str, release: str) -> Path:
     """Determine the directory where data files are stored for a data release
 
@@ -41,23 +57,98 @@ def find_data_dir(survey_abbrev: str, release: str) -> Path:
     # Enforce the use of lowercase file names
     safe_survey = survey_abbrev.lower().replace(' ', '_')
     safe_release = release.lower().replace(' ', '_')
+    return _find_base_dir() / safe_survey / safe_release
 
-    # Default to using data directory specified in the environment
-    if 'SNDATA_DIR' in os.environ:
-        base_dir = Path(os.environ['SNDATA_DIR']).resolve()
 
-    else:
-        base_dir = Path(__file__).resolve().parent.parent / 'data'
+def find_cache_dir(name: str) -> Path:
+    """Determine the directory where cached values are stored
 
-    data_dir = base_dir / safe_survey / safe_release
-    return data_dir
+    Cached values are kept separately from downloaded data so that writing
+    them does not modify any data directories.
+
+    Args:
+        name: Name of the cache (e.g., combined or csp_dr3)
+
+    Returns:
+        The path of the cache directory
+    """
+
+    safe_name = name.lower().replace(' ', '_')
+    return _find_base_dir() / 'cache' / safe_name
+
+
+def list_file_names(
+        directory: Path,
+        prefix: str = '',
+        suffix: str = '',
+        recursive: bool = False
+) -> List[str]:
+    """Return the names of files in a directory
+
+    Uses ``os.scandir`` so file types come from the directory listing
+    without a separate ``stat`` call per file. Hidden files and directories
+    are ignored, consistent with ``glob('*')``.
+
+    Args:
+        directory: The directory to list files from
+        prefix: Only return file names starting with this string
+        suffix: Only return file names ending with this string
+        recursive: Also include files from subdirectories (Default: False)
+
+    Returns:
+        A list of file names or an empty list if ``directory`` does not exist
+    """
+
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+
+    except FileNotFoundError:
+        return []
+
+    file_names = []
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+
+        if entry.is_file():
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                file_names.append(entry.name)
+
+        elif recursive and entry.is_dir():
+            file_names.extend(list_file_names(entry.path, prefix, suffix, recursive))
+
+    return file_names
 
 
 def parse_vizier_table_descriptions(readme_path: Union[Path, str]):
     """Returns the table descriptions from a vizier readme file
 
+    Parsed descriptions are cached until the file is modified.
+
+    Args:
+        readme_path: Path of the file to read
+
+    Returns:
+        A dictionary {<Table number (int)>: <Table description (str)>}
+    """
+
+    readme_path = Path(readme_path).resolve()
+    mtime = readme_path.stat().st_mtime_ns
+    return dict(_parse_vizier_table_descriptions(readme_path, mtime))
+
+
+# noinspection PyUnusedLocal
+@lru_cache(maxsize=32)
+def _parse_vizier_table_descriptions(readme_path: Path, mtime: int) -> dict:
+    """Cached backend for ``parse_vizier_table_descriptions``
+
+    The modification time is part of the cache key so edited files are
+    parsed again.
+
     Args:
         readme_path: Path of the file to read
+        mtime: Modification time of the file in nanoseconds
 
     Returns:
         A dictionary {<Table number (int)>: <Table description (str)>}
@@ -95,31 +186,107 @@ def parse_vizier_table_descriptions(readme_path: Union[Path, str]):
     return table_descriptions
 
 
-def register_filter_file(file_path: str, filter_name: str, force: bool = False):
-    """Registers filter profiles with sncosmo if not already registered
+def get_registered_bands() -> set:
+    """Return the names of all builtin and custom bandpasses known to sncosmo
 
-    Assumes the file at ``file_path`` is a two column, white space delimited
-    ascii table.
+    Returns:
+        A set of bandpass names
+    """
+
+    # noinspection PyProtectedMember
+    bandpass_registry = sncosmo.bandpasses._BANDPASSES
+    available_bands = set(k[0] for k in bandpass_registry._loaders)
+    available_bands.update(k[0] for k in bandpass_registry._instances)
+    return available_bands
+
+
+def read_filter_file(file_path: Union[Path, str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Read a filter profile from a two column ascii table
+
+    Assumes the file at ``file_path`` is a white space delimited table of
+    wavelength and transmission values. Rows with missing values are dropped.
 
     Args:
         file_path: Path of ascii table with wavelength (Ang) and transmission
-        filter_name: The name of the registered filter.
+
+    Returns:
+        An array of wavelengths and an array of transmission values
+    """
+
+    try:
+        wave, trans = np.loadtxt(file_path, unpack=True)
+
+    except ValueError:
+        # Fall back to the slower parser for files with missing values
+        wave, trans = np.genfromtxt(file_path).T
+
+    is_good_data = ~np.isnan(wave) & ~np.isnan(trans)
+    return wave[is_good_data], trans[is_good_data]
+
+
+def register_filter_files(
+        file_paths: Iterable[Union[Path, str]],
+        filter_names: Iterable[str],
+        force: bool = False,
+        available_bands: set = None,
+        max_workers: int = 4):
+    """Registers multiple filter profiles with sncosmo if not already registered
+
+    Filter files are read concurrently using a pool of threads. Bandpasses
+    are then registered one at a time since the sncosmo registry is shared
+    state. ``available_bands`` is updated with any newly registered band.
+
+    Args:
+        file_paths: Paths of ascii tables with wavelength (Ang) and transmission
+        filter_names: The name of each registered filter
         force: Whether to re-register a band if already registered
+        available_bands: Optional set of bandpass names already registered
+        max_workers: Maximum number of files to read at once (Default: 4)
     """
 
-    # Get set of registered builtin and custom band passes
-    # noinspection PyProtectedMember
-    available_bands = set(
-        k[0] for k in sncosmo.bandpasses._BANDPASSES._loaders)
+    if available_bands is None:
+        available_bands = get_registered_bands()
 
-    # noinspection PyProtectedMember
-    available_bands.update(
-        k[0] for k in sncosmo.bandpasses._BANDPASSES._instances)
+    new_filters = [
+        (file_path, filter_name) for file_path, filter_name
+        in zip(file_paths, filter_names) if filter_name not in available_bands
+    ]
 
-    # Register the new bandpass
-    if filter_name not in available_bands:
-        wave, trans = np.genfromtxt(file_path).T
-        is_good_data = ~np.isnan(wave) & ~np.isnan(trans)
-        band = sncosmo.Bandpass(wave[is_good_data], trans[is_good_data])
+    new_paths = [file_path for file_path, _ in new_filters]
+    if len(new_paths) > 1:
+        max_workers = max(1, min(max_workers, len(new_paths)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            profiles = list(executor.map(read_filter_file, new_paths))
+
+    else:
+        profiles = [read_filter_file(file_path) for file_path in new_paths]
+
+    for (_, filter_name), (wave, trans) in zip(new_filters, profiles):
+        band = sncosmo.Bandpass(wave, trans)
         band.name = filter_name
         sncosmo.register(band, force=force)
+        available_bands.add(filter_name)
+
+
+def register_filter_file(
+        file_path: str,
+        filter_name: str,
+        force: bool = False,
+        available_bands: set = None):
+    """Registers filter profiles with sncosmo if not already registered
+
+    Assumes the file at ``file_path`` is a two column, white space delimited
+    ascii table. When registering multiple filters, use
+    ``register_filter_files`` or pass the output of ``get_registered_bands``
+    as ``available_bands`` to avoid rebuilding it for every filter. The set
+    is updated with any newly registered band.
+
+    Args:
+        file_path: Path of ascii table with wavelength (Ang) and transmission
+        filter_name: The name of the registered filter.
+        force: Whether to re-register a band if already registered
+        available_bands: Optional set of bandpass names already registered
+    """
+
+    register_filter_files(
+        [file_path], [filter_name], force=force, available_bands=available_bands)
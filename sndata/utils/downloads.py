@@ -2,15 +2,48 @@
 formats.
 """
 
+import hashlib
 import sys
 import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import IO, Union
+from typing import IO, Iterable, Union
 
 import requests
 from tqdm import tqdm
 
+# Requests sessions are not documented as thread safe, so each thread keeps
+# its own session and reuses connections across its downloads
+_thread_local = threading.local()
+
+# Maximum number of requests open at once across all threads
+_max_connections = 8
+_connection_slots = threading.BoundedSemaphore(_max_connections)
+
+# Number of bytes to read into memory at a time when streaming downloads
+_chunk_size = 1024 * 1024
+
+
+def _get_session() -> requests.Session:
+    """Return the requests session for the current thread"""
+
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+
+    return session
+
+
+def _show_progress() -> bool:
+    """Return whether download progress bars should be displayed
+
+    Bars written from several threads at once interleave on stdout, so they
+    are only displayed for downloads running on the main thread.
+    """
+
+    return threading.current_thread() is threading.main_thread()
+
 
 def download_file(
         url: str,
@@ -21,7 +54,8 @@ def download_file(
     """Download content from a url to a file
 
     If ``destination`` is a path but already exists, skip the
-    download unless ``force`` is also ``True``.
+    download unless ``force`` is also ``True``. Path destinations are only
+    written once the download has finished successfully.
 
     Args:
         url: URL of the file to download
@@ -37,28 +71,115 @@ def download_file(
         if (not force) and path.exists():
             return
 
+        # Write to a temporary file so a failed download never leaves a
+        # partial file behind that later calls would skip as existing
         path.parent.mkdir(exist_ok=True, parents=True)
-        destination = path.open('wb')
+        temp_path = path.with_name(f'.{path.name}.part')
+        destination = temp_path.open('wb')
+
+    try:
+        _write_url_content(url, destination, timeout, verbose)
+
+    except BaseException:
+        if destination_is_path:
+            destination.close()
+            temp_path.unlink()
+
+        raise
+
+    if destination_is_path:
+        destination.close()
+        temp_path.replace(path)
+
+
+def _write_url_content(url: str, destination: IO, timeout: float, verbose: bool):
+    """Stream content from a url into an open file object
+
+    Args:
+        url: URL of the file to download
+        destination: File object to write to
+        timeout: Seconds before raising timeout error
+        verbose: Print status to stdout
+    """
 
     if verbose:
         tqdm.write(f'Fetching {url}', file=sys.stdout)
-        response = requests.get(url, stream=True, timeout=timeout)
+
+    # Stream the response so large archives are never held in memory
+    with _connection_slots, _get_session().get(url, stream=True, timeout=timeout) as response:
         response.raise_for_status()
+        chunks = response.iter_content(chunk_size=_chunk_size)
 
-        total = int(response.headers.get('content-length', 0))
-        chunk_size = 1024
-        with tqdm(total=total, unit='B', unit_scale=True, unit_divisor=chunk_size, file=sys.stdout) as pbar:
-            for data in response.iter_content(chunk_size=chunk_size):
-                pbar.update(destination.write(data))
+        if verbose and _show_progress():
+            total = int(response.headers.get('content-length', 0))
+            with tqdm(total=total, unit='B', unit_scale=True, unit_divisor=1024, file=sys.stdout) as pbar:
+                for data in chunks:
+                    pbar.update(destination.write(data))
 
-    else:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        destination.write(response.content)
-        destination.write(response.content)
+        else:
+            for data in chunks:
+                destination.write(data)
 
-    if destination_is_path:
-        destination.close()
+
+def download_files(
+        urls: Iterable[str],
+        destinations: Iterable[Union[str, Path]],
+        force: bool = False,
+        timeout: float = 15,
+        verbose: bool = True,
+        max_workers: int = 8):
+    """Download content from multiple urls to files concurrently
+
+    Downloads are network bound, so files are fetched using a pool of
+    threads. Any destination that already exists is skipped unless
+    ``force`` is also ``True``. Progress bars for individual files are not
+    displayed while downloading in parallel. No more than eight requests
+    are open at once across all threads, however many pools are running.
+
+    Args:
+        urls: URLs of the files to download
+        destinations: Paths to download each file to
+        force: Re-Download locally available data (Default: False)
+        timeout: Seconds before raising timeout error (Default: 15)
+        verbose: Print status to stdout
+        max_workers: Maximum number of concurrent downloads (Default: 8)
+    """
+
+    jobs = list(zip(urls, destinations))
+    max_workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                download_file,
+                url=url,
+                destination=destination,
+                force=force,
+                timeout=timeout,
+                verbose=verbose)
+            for url, destination in jobs
+        ]
+
+        # Re-raise any errors encountered while downloading
+        for future in futures:
+            future.result()
+
+
+def _get_stamp_path(url: str, out_dir: Path) -> Path:
+    """Return the path of the file marking an archive as extracted
+
+    Multiple archives can be extracted into the same directory, so the file
+    name includes a hash of the archive URL.
+
+    Args:
+        url: URL of the downloaded archive
+        out_dir: The directory the archive is extracted to
+
+    Returns:
+        A hidden file path within ``out_dir``
+    """
+
+    url_hash = hashlib.md5(url.encode()).hexdigest()
+    return out_dir / f'.sndata_{url_hash}.stamp'
 
 
 def download_tar(
@@ -86,21 +207,33 @@ def download_tar(
     if skip_exists and Path(skip_exists).exists() and not force:
         return
 
-    # Download data to file and decompress
-    with NamedTemporaryFile() as temp_file:
-        download_file(url, destination=temp_file, timeout=timeout)
+    # Skip download if this archive was already fully extracted to ``out_dir``
+    stamp_path = _get_stamp_path(url, out_dir)
+    if stamp_path.exists() and not force:
+        return
+
+    # Tar files are read sequentially in stream mode, so members are
+    # extracted as they arrive instead of buffering the archive on disk
+    stream_mode = mode.replace(':', '|') if ':' in mode else f'{mode}|*'
 
-        # Writing to the file moves us to the end of the file
-        # We move back to the beginning so we can decompress the data
-        temp_file.seek(0)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tqdm.write(f'Fetching {url}', file=sys.stdout)
+    with _connection_slots, _get_session().get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        total = int(response.headers.get('content-length', 0))
+        with tqdm.wrapattr(response.raw, 'read', total=total, file=sys.stdout, disable=not _show_progress()) as stream, \
+                tarfile.open(fileobj=stream, mode=stream_mode) as data_archive:
 
-        out_dir.mkdir(parents=True, exist_ok=True)
-        with tarfile.open(fileobj=temp_file, mode=mode) as data_archive:
             for ffile in data_archive:
-                try:
-                    data_archive.extract(ffile, path=out_dir)
+                # Stream data can only be read once, so delete any
+                # existing output file (which may be read only) up front
+                out_path = out_dir / ffile.name
+                if not ffile.isdir() and out_path.is_file():
+                    out_path.unlink()
+
+                data_archive.extract(ffile, path=out_dir)
 
-                except IOError:
-                    # If output path already exists, delete it and try again
-                    (out_dir / ffile.name).unlink()
-                    data_archive.extract(ffile, path=out_dir)
+    # Record that the archive was extracted successfully
+    stamp_path.write_text(url)
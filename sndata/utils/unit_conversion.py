@@ -3,11 +3,15 @@ units / timezones / systems of measurement.
 """
 
 from datetime import datetime
+from typing import Tuple
 
 import numpy as np
 from astropy.coordinates import Angle
 from pytz import utc
 
+# Conversion factor between magnitudes and the natural log of flux
+_LN10_OVER_2P5 = np.log(10) / 2.5
+
 
 def hourangle_to_degrees(
         rah: float,
@@ -42,6 +46,30 @@ def hourangle_to_degrees(
     return ra, dec
 
 
+def mag_to_flux(mag: np.ndarray, mag_err: np.ndarray, zp: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert magnitudes and magnitude errors into flux and flux errors
+
+    Intermediate values are computed in place so each output array is
+    allocated only once.
+
+    Args:
+        mag: Array of magnitudes
+        mag_err: Array of magnitude errors
+        zp: Zero point of each magnitude
+
+    Returns:
+        An array of fluxes and an array of flux errors
+    """
+
+    flux = np.subtract(zp, mag, dtype=float)
+    flux *= _LN10_OVER_2P5
+    np.exp(flux, out=flux)
+
+    fluxerr = np.multiply(flux, _LN10_OVER_2P5)
+    fluxerr *= mag_err
+    return flux, fluxerr
+
+
 @np.vectorize
 def convert_to_jd(date: float, format: str) -> float:
     """Convert dates into JD
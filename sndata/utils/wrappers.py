@@ -4,7 +4,10 @@ parent package.
 
 import functools
 import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from itertools import islice
 from typing import Union
 
 from tqdm import tqdm
@@ -26,7 +29,9 @@ def lru_copy_cache(maxsize: int = 128, typed: bool = False, copy: bool = True):
     """Decorator to cache the return of a function
 
     Similar to ``functools.lru_cache``, but allows a copy of the cached value
-    to be returned, thus preventing mutation of the cache.
+    to be returned, thus preventing mutation of the cache. The wrapped
+    function exposes the ``cache_info`` and ``cache_clear`` methods of the
+    underlying cache.
 
     Args:
         maxsize: Maximum size of the cache
@@ -49,6 +54,8 @@ def lru_copy_cache(maxsize: int = 128, typed: bool = False, copy: bool = True):
         def wrapper(*args, **kwargs):
             return deepcopy(cached_func(*args, **kwargs))
 
+        wrapper.cache_info = cached_func.cache_info
+        wrapper.cache_clear = cached_func.cache_clear
         return wrapper
 
     return decorator
@@ -74,3 +81,60 @@ def build_pbar(data: iter, verbose: Union[bool, dict]):
         iter_data = data
 
     return iter_data
+
+
+# Function called by ``process_map`` in each worker process
+_worker_func = None
+
+
+def _set_worker_func(func: callable):
+    """Store the function called by ``process_map`` in a worker process"""
+
+    global _worker_func
+    _worker_func = func
+
+
+def _call_worker_func(value):
+    """Call the function stored by ``_set_worker_func`` on ``value``"""
+
+    return _worker_func(value)
+
+
+def process_map(func: callable, data: iter, n_jobs: int, lookahead: int = 2):
+    """Iterate over ``func`` applied to ``data`` using a pool of processes
+
+    ``func`` is sent to each worker process once when the pool starts. At
+    most ``lookahead`` values per process are submitted ahead of the caller,
+    so results are never buffered for all of ``data``. Any pending work is
+    cancelled once the caller stops iterating.
+
+    Args:
+        func: A picklable function accepting a single argument
+        data: An iterable of picklable values
+        n_jobs: Number of worker processes
+        lookahead: Number of values per process to submit ahead of time
+
+    Yields:
+        Return values of ``func`` in the same order as ``data``
+    """
+
+    data = iter(data)
+    executor = ProcessPoolExecutor(n_jobs, initializer=_set_worker_func, initargs=(func,))
+    pending = deque(
+        executor.submit(_call_worker_func, value)
+        for value in islice(data, n_jobs * lookahead)
+    )
+
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for value in islice(data, 1):
+                pending.append(executor.submit(_call_worker_func, value))
+
+            yield result
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown()
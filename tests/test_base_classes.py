@@ -0,0 +1,265 @@
+"""Tests for the ``base_classes`` module."""
+
+import os
+import shutil
+import time
+import warnings
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import astropy
+from astropy.table import Table
+
+from sndata.base_classes import DefaultParser, PhotometricRelease, SpectroscopicRelease
+
+# Example Vizier table and ReadMe distributed with astropy
+_vizier_dir = Path(astropy.__file__).parent / 'io' / 'ascii' / 'tests' / 'data' / 'vizier'
+
+
+class FakeRelease(SpectroscopicRelease):
+    """Data release serving a single row table for each of five object IDs
+
+    Parsing each table takes a short time and issues a warning, like many of
+    the real parsers do. IDs parsed in the current process are recorded.
+    """
+
+    survey_name = 'Fake Survey'
+    survey_abbrev = 'fake_survey'
+    release = 'fake_release'
+    survey_url = 'https://fake.url'
+    publications = ('Fake et al. 2020',)
+    ads_url = 'https://fake.url'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed_ids = []
+
+    def _get_available_tables(self):
+        return []
+
+    def _load_table(self, table_id):
+        raise NotImplementedError
+
+    def _get_available_ids(self):
+        return ['obj_1', 'obj_2', 'obj_3', 'obj_4', 'obj_5']
+
+    def _get_data_for_id(self, obj_id, format_table=True):
+        self.parsed_ids.append(obj_id)
+        time.sleep(.05)
+        warnings.warn(f'Warning issued while parsing {obj_id}')
+        return Table({'time': [1.0]}, meta={'obj_id': obj_id})
+
+    def _download_module_data(self, force=False, timeout=15):
+        pass
+
+
+class IterData(TestCase):
+    """Tests for the ``iter_data`` method"""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.test_class = FakeRelease()
+        self.test_class._data_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_caller_warnings_are_not_hidden(self):
+        """Test warnings issued while consuming tables reach the caller"""
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for data_table in self.test_class.iter_data():
+                warnings.warn(f'Caller warning for {data_table.meta["obj_id"]}')
+
+        messages = [str(w.message) for w in caught]
+        expected = [f'Caller warning for {obj_id}' for obj_id in self.test_class.get_available_ids()]
+        self.assertListEqual(expected, messages)
+
+    def test_filter_id_func(self):
+        """Test data is only read for object IDs passing ``filter_id_func``"""
+
+        selected_ids = ['obj_2', 'obj_4']
+        returned_ids = [
+            data_table.meta['obj_id'] for data_table in
+            self.test_class.iter_data(filter_id_func=lambda obj_id: obj_id in selected_ids)
+        ]
+
+        self.assertListEqual(selected_ids, returned_ids)
+        self.assertListEqual(selected_ids, self.test_class.parsed_ids)
+
+    def test_filter_id_func_in_parallel(self):
+        """Test ``filter_id_func`` is applied when parsing in worker processes"""
+
+        data_iter = self.test_class.iter_data(
+            filter_id_func=lambda obj_id: obj_id != 'obj_3', n_jobs=2)
+
+        returned_ids = [data_table.meta['obj_id'] for data_table in data_iter]
+        self.assertListEqual(['obj_1', 'obj_2', 'obj_4', 'obj_5'], returned_ids)
+
+    def test_parallel_matches_serial(self):
+        """Test parsing in worker processes yields the same tables in order"""
+
+        serial_ids = [t.meta['obj_id'] for t in self.test_class.iter_data()]
+        parallel_ids = [t.meta['obj_id'] for t in self.test_class.iter_data(n_jobs=2)]
+        self.assertListEqual(serial_ids, parallel_ids)
+
+    def test_parallel_leaves_warning_filters(self):
+        """Test parsing in worker processes does not change warning filters"""
+
+        with warnings.catch_warnings():
+            filters = list(warnings.filters)
+            for _ in self.test_class.iter_data(n_jobs=2):
+                pass
+
+            self.assertListEqual(filters, warnings.filters)
+
+
+class FakeVizierRelease(DefaultParser, FakeRelease):
+    """Fake data release serving tables with the default Vizier parser"""
+
+    # Cache parsed tables regardless of size
+    _table_cache_min_size = 0
+
+
+class FakePhotometricVizierRelease(PhotometricRelease, DefaultParser):
+    """Fake photometric release inheriting from ``DefaultParser`` last"""
+
+    survey_name = 'Fake Survey'
+    survey_abbrev = 'fake_survey'
+    release = 'fake_photometric_release'
+    survey_url = 'https://fake.url'
+    publications = ('Fake et al. 2020',)
+    ads_url = 'https://fake.url'
+
+    _table_cache_min_size = 0
+    _get_available_tables = DefaultParser._get_available_tables
+    _load_table = DefaultParser._load_table
+
+    def _get_available_ids(self):
+        return []
+
+    def _get_data_for_id(self, obj_id, format_table=True):
+        raise NotImplementedError
+
+    def _download_module_data(self, force=False, timeout=15):
+        pass
+
+
+class LoadTableCache(TestCase):
+    """Tests for caching parsed tables in ``DefaultParser._load_table``"""
+
+    def setUp(self):
+        # Keep data and cached tables for the fake release out of the package
+        self.temp_dir = TemporaryDirectory()
+        self.old_dir = os.environ.get('SNDATA_DIR', None)
+        os.environ['SNDATA_DIR'] = self.temp_dir.name
+
+        self.test_class = self.create_release(FakeVizierRelease)
+        self.cache_path = self.test_class._cache_dir / 'table1.ecsv'
+
+    def tearDown(self):
+        if self.old_dir is None:
+            del os.environ['SNDATA_DIR']
+
+        else:
+            os.environ['SNDATA_DIR'] = self.old_dir
+
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def create_release(release_class, **kwargs):
+        """Instantiate a release and copy the example Vizier data into it"""
+
+        release = release_class(**kwargs)
+        release._table_dir.mkdir(parents=True)
+        for file_name in ('ReadMe', 'table1.dat'):
+            shutil.copy(_vizier_dir / file_name, release._table_dir)
+
+        return release
+
+    def edit_cached_description(self):
+        """Change the description stored in the cached table"""
+
+        cached_table = Table.read(self.cache_path, format='ascii.ecsv')
+        cached_table.meta['description'] = 'Cached description'
+        cached_table.write(self.cache_path, format='ascii.ecsv', overwrite=True)
+
+    def test_cached_table_is_reused(self):
+        """Test the cached table is returned while the source is unchanged"""
+
+        original = self.test_class._load_table(1)
+        self.edit_cached_description()
+        cached = self.test_class._load_table(1)
+
+        self.assertNotIn('source_version', original.meta)
+        self.assertNotIn('source_version', cached.meta)
+        self.assertEqual('Cached description', cached.meta['description'])
+        self.assertListEqual(original.as_array().tolist(), cached.as_array().tolist())
+
+    def test_older_source_invalidates_cache(self):
+        """Test the cache is ignored when the source has an older mtime
+
+        Extracting a tar archive restores the modification times of its
+        members, so re-downloaded files can be older than the cache.
+        """
+
+        original = self.test_class._load_table(1)
+        self.edit_cached_description()
+
+        table_path = self.test_class._table_dir / 'table1.dat'
+        os.utime(table_path, ns=(0, table_path.stat().st_mtime_ns - 10 ** 9))
+        reparsed = self.test_class._load_table(1)
+        self.assertEqual(original.meta['description'], reparsed.meta['description'])
+
+    def test_delete_module_data_deletes_cached_tables(self):
+        """Test ``delete_module_data`` removes cached tables from disk"""
+
+        self.test_class._load_table(1)
+        self.assertTrue(self.cache_path.exists())
+
+        self.test_class.delete_module_data()
+        self.assertFalse(self.cache_path.exists())
+
+    def test_delete_module_data_with_parser_last(self):
+        """Test cached tables are deleted when ``DefaultParser`` is inherited last"""
+
+        test_class = self.create_release(FakePhotometricVizierRelease)
+        test_class._load_table(1)
+        self.assertTrue(test_class._cache_dir.exists())
+
+        test_class.delete_module_data()
+        self.assertFalse(test_class._cache_dir.exists())
+
+    def test_download_keeps_cached_tables(self):
+        """Test cached tables are kept when re-running the download"""
+
+        self.test_class._load_table(1)
+        self.test_class.download_module_data()
+        self.assertTrue(self.cache_path.exists())
+
+    def test_clear_cache_keeps_other_releases(self):
+        """Test ``clear_cache`` only drops tables loaded by the same release"""
+
+        other_release = self.create_release(FakeVizierRelease, release='other_release')
+        self.test_class.load_table(1)
+        other_release.load_table(1)
+
+        self.test_class.clear_cache()
+        self.assertNotIn(1, self.test_class._loaded_tables)
+        self.assertIn(1, other_release._loaded_tables)
+
+    def test_caching_keeps_data_version(self):
+        """Test writing a cached table does not change the data version"""
+
+        data_version = self.test_class._get_data_version()
+        self.test_class._load_table(1)
+        self.assertEqual(data_version, self.test_class._get_data_version())
+
+    def test_small_tables_are_not_cached(self):
+        """Test tables smaller than the size threshold are not cached"""
+
+        self.test_class._table_cache_min_size = 1024 * 1024
+        self.test_class._load_table(1)
+        self.assertFalse(self.cache_path.exists())
@@ -1,14 +1,20 @@
 """Test that survey data is accessed and served correctly for combined data sets."""
 
+import os
+import time
+import warnings
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from astropy.table import vstack
 
+import sndata
 from sndata import CombinedDataset
 from sndata import csp, des
 from sndata._combine_data import reduce_id_mapping
 from .common_tests import PhotometricDataParsing
-from .test_exceptions import InvalidTableId
+from .test_base_classes import FakeRelease
+from .test_exceptions import InvalidObjId, InvalidTableId
 
 
 class CombinedDataParsing(TestCase, PhotometricDataParsing):
@@ -26,6 +32,15 @@ class CombinedDataParsing(TestCase, PhotometricDataParsing):
         fake_table_id = ('fake_id', 'fake_release', 'fake_survey')
         self.assertRaises(InvalidTableId, self.test_class.load_table, fake_table_id)
 
+    def test_id_frame_includes_all_ids(self):
+        """Test no object IDs are dropped when combining data releases"""
+
+        expected_length = sum(
+            len(survey.get_available_ids()) for survey in self.joined_surveys)
+
+        self.assertEqual(
+            expected_length, len(self.test_class._obj_id_dataframe))
+
     def test_id_joining(self):
         """Test correct data is returned after joining / separating IDs"""
 
@@ -104,6 +119,113 @@ class CombinedDataStringIDs(TestCase):
             combined_data.get_data_for_id('2010ae')
 
 
+class CombinedFakeData(TestCase):
+    """Tests CombinedDataset objects built from a fake data release"""
+
+    def setUp(self):
+        # Keep data and ID caches for the fake release out of the package
+        self.temp_dir = TemporaryDirectory()
+        self.old_dir = os.environ.get('SNDATA_DIR', None)
+        os.environ['SNDATA_DIR'] = self.temp_dir.name
+
+        self.release = FakeRelease()
+        self.release._data_dir.mkdir(parents=True)
+        self.test_class = CombinedDataset(self.release)
+
+    def tearDown(self):
+        if self.old_dir is None:
+            del os.environ['SNDATA_DIR']
+
+        else:
+            os.environ['SNDATA_DIR'] = self.old_dir
+
+        self.temp_dir.cleanup()
+
+    def test_caller_warnings_are_not_hidden(self):
+        """Test warnings issued while consuming tables reach the caller"""
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for data_table in self.test_class.iter_data():
+                warnings.warn(f'Caller warning for {data_table.meta["obj_id"]}')
+
+        messages = [str(w.message) for w in caught]
+        expected = [f'Caller warning for {obj_id[0]}' for obj_id in self.test_class.get_available_ids()]
+        self.assertListEqual(expected, messages)
+
+    def test_iter_data_filter_id_func(self):
+        """Test data is only read for object IDs passing ``filter_id_func``"""
+
+        selected_id = ('obj_2', 'fake_release', 'fake_survey')
+        data_tables = list(self.test_class.iter_data(filter_id_func=lambda obj_id: obj_id == selected_id))
+
+        self.assertEqual(1, len(data_tables))
+        self.assertEqual('obj_2', data_tables[0].meta['obj_id'])
+        self.assertListEqual(['obj_2'], self.release.parsed_ids)
+
+    def test_id_cache_depends_on_version(self):
+        """Test the on disk ID cache is not shared across package versions"""
+
+        cache_path = self.test_class._id_cache_path()
+        old_version = sndata.__version__
+        sndata.__version__ = 'test_version'
+        try:
+            new_cache_path = self.test_class._id_cache_path()
+
+        finally:
+            sndata.__version__ = old_version
+
+        self.assertNotEqual(cache_path, new_cache_path)
+
+    def test_old_id_caches_are_removed(self):
+        """Test writing the ID cache deletes caches made for older data"""
+
+        self.test_class.get_available_ids()
+        old_cache_paths = list(self.test_class._id_cache_path().parent.iterdir())
+
+        # Adding a file changes the data version of the release
+        time.sleep(.01)
+        (self.release._data_dir / 'new_file.txt').touch()
+        self.test_class.clear_cache()
+        self.test_class.get_available_ids()
+        new_cache_paths = list(self.test_class._id_cache_path().parent.iterdir())
+
+        self.assertEqual(1, len(old_cache_paths))
+        self.assertListEqual([self.test_class._id_cache_path()], new_cache_paths)
+        self.assertNotEqual(old_cache_paths, new_cache_paths)
+
+    def test_get_data_for_ids_mixed_ids(self):
+        """Test tables are returned in order for string and tuple IDs"""
+
+        obj_ids = ['obj_3', ('obj_1', 'fake_release', 'fake_survey'), 'obj_2']
+        data_tables = self.test_class.get_data_for_ids(obj_ids)
+        returned_ids = [data_table.meta['obj_id'] for data_table in data_tables]
+        self.assertListEqual(['obj_3', 'obj_1', 'obj_2'], returned_ids)
+
+    def test_get_data_for_ids_unknown_id(self):
+        """Test an ``InvalidObjId`` error is raised for unknown IDs"""
+
+        with self.assertRaises(InvalidObjId):
+            self.test_class.get_data_for_ids(['obj_1', 'fake_id'])
+
+        with self.assertRaises(InvalidObjId):
+            self.test_class.get_data_for_ids([('obj_1', 'fake_release', 'unknown_survey')])
+
+    def test_get_data_for_ids_duplicate_id(self):
+        """Test an error is raised for string IDs shared by multiple releases"""
+
+        other_release = FakeRelease(release='other_release')
+        other_release._data_dir.mkdir(parents=True)
+        combined_data = CombinedDataset(self.release, other_release)
+
+        with self.assertRaises(RuntimeError):
+            combined_data.get_data_for_ids(['obj_1'])
+
+        tuple_id = ('obj_1', 'other_release', 'fake_survey')
+        data_tables = combined_data.get_data_for_ids([tuple_id])
+        self.assertEqual('obj_1', data_tables[0].meta['obj_id'])
+
+
 class MapReduction(TestCase):
     """Tests for the reduce_id_mapping function"""
 
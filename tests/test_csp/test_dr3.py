@@ -1,10 +1,13 @@
 """Tests for the ``csp.DR3`` class."""
 
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import numpy as np
 
 from sndata.csp import DR3
+from sndata.csp._dr3 import fix_dr3_readme
 from ..common_tests import PhotometricDataParsing, PhotometricDataUI, download_data_or_skip
 
 download_data_or_skip(DR3())
@@ -45,3 +48,102 @@ class DR3UI(TestCase, PhotometricDataUI):
     @classmethod
     def setUpClass(cls):
         cls.test_class = DR3()
+
+
+class FixDR3Readme(TestCase):
+    """Tests for the ``fix_dr3_readme`` function"""
+
+    # Byte-by-byte descriptions of Tables 2 and 3 as published
+    readme_excerpt = """\
+Byte-by-byte Description of file: table2.dat
+--------------------------------------------------------------------------------
+   Bytes Format Units   Label     Explanations
+--------------------------------------------------------------------------------
+   1-  6  A6    ---     SN        Supernova name
+  56- 60  F5.3  mag     dm15      [0.734/2.256]? Decline rate
+  62- 66  F5.3  mag   e_dm15      [0.036/0.198]? Uncertainty in dm15
+  68- 72  A5    ---     WType     Wang et al. (2009) spectroscopic subtype
+  74- 76  A3    ---     BType     Branch et al. (2006) spectroscopic subtype
+  78- 80  I3    d       Phase     [-11/66]? Phase of first spectrum
+--------------------------------------------------------------------------------
+
+Byte-by-byte Description of file: table3.dat
+--------------------------------------------------------------------------------
+   Bytes Format Units   Label     Explanations
+--------------------------------------------------------------------------------
+   1-  6  A6    ---     SN        Supernova name
+   8- 15  F8.2  d       Tmax      [53263.77/54960.03]? Time of B maximum
+  17- 20  F4.2  d     e_Tmax      [0.06/2.71]? Uncertainty in Tmax
+  22- 29  F8.2  d       Tmax2     [53234.7/55165.94]? Time of maximum
+  31- 34  F4.2  ---     sBV       [0.6/1.24]? Color stretch
+  36- 40  F5.3  ---   e_sBV       [0.278/1.993]? Uncertainty in sBV
+  42- 46  F5.3  mag     EBV       [0.01/0.175]? Host reddening
+  48- 52  F5.3  mag     dm15      [0.734/2.256]? Decline rate
+  54- 58  F5.3  mag   e_dm15      [0.036/0.198]? Uncertainty in dm15
+  60- 64  F5.3  mag     Bmax      [0.301/1.188]? Peak B magnitude
+  66- 70  F5.3  mag   e_Bmax      [0.005/1.761]? Uncertainty in Bmax
+  72- 75  F4.2  mag     Vmax      [0.06/1.28]? Peak V magnitude
+  77- 81  F5.3  mag   e_Vmax      [0.06/0.067]? Uncertainty in Vmax
+--------------------------------------------------------------------------------
+
+References:
+    Wang et al. 2009, ApJ, 699, L139
+    Branch et al. 2006, PASP, 118, 560
+"""
+
+    # The same excerpt as fixed by the original line number based edits
+    fixed_excerpt = """\
+Byte-by-byte Description of file: table2.dat
+--------------------------------------------------------------------------------
+   Bytes Format Units   Label     Explanations
+--------------------------------------------------------------------------------
+   1-  6  A6    ---     SN        Supernova name
+  56- 60  F5.3  mag     dm15      ?=- Decline rate
+  62- 66  F5.3  mag   e_dm15      ? Uncertainty in dm15
+  68- 72  A5    ---     WType     ?=- Wang et al. (2009) spectroscopic subtype
+  74- 76  A3    ---     BType     ?=- Branch et al. (2006) spectroscopic subtype
+  78- 80  I3    d       Phase     ?=- Phase of first spectrum
+--------------------------------------------------------------------------------
+
+Byte-by-byte Description of file: table3.dat
+--------------------------------------------------------------------------------
+   Bytes Format Units   Label     Explanations
+--------------------------------------------------------------------------------
+   1-  6  A6    ---     SN        Supernova name
+   8- 15  F8.2  d       Tmax      ?=- Time of B maximum
+  17- 20  F4.2  d     e_Tmax      ? Uncertainty in Tmax
+  22- 29  F8.2  d       Tmax2     ?=- Time of maximum
+  31- 34  F4.2  ---     sBV       ? Color stretch
+  36- 40  F5.3  ---   e_sBV       ?=- Uncertainty in sBV
+  42- 46  F5.3  mag     EBV       ? Host reddening
+  48- 52  F5.3  mag     dm15      ?=- Decline rate
+  54- 58  F5.3  mag   e_dm15      ? Uncertainty in dm15
+  60- 64  F5.3  mag     Bmax      ?=- Peak B magnitude
+  66- 70  F5.3  mag   e_Bmax      ? Uncertainty in Bmax
+  72- 75  F4.2  mag     Vmax      ?=- Peak V magnitude
+  77- 81  F5.3  mag   e_Vmax      ? Uncertainty in Vmax
+--------------------------------------------------------------------------------
+
+References:
+    Wang et al. 2009, ApJ, 699, L139
+    Branch et al. 2006, PASP, 118, 560
+"""
+
+    def test_typos_are_fixed(self):
+        """Test the fixed excerpt matches the original line based fixes"""
+
+        with TemporaryDirectory() as temp_dir:
+            readme_path = Path(temp_dir) / 'ReadMe'
+            readme_path.write_text(self.readme_excerpt)
+            fix_dr3_readme(readme_path)
+            self.assertEqual(self.fixed_excerpt, readme_path.read_text())
+
+    def test_fix_is_idempotent(self):
+        """Test fixing an already fixed excerpt does not change it"""
+
+        with TemporaryDirectory() as temp_dir:
+            readme_path = Path(temp_dir) / 'ReadMe'
+            readme_path.write_text(self.readme_excerpt)
+            fix_dr3_readme(readme_path)
+            fix_dr3_readme(readme_path)
+            self.assertEqual(self.fixed_excerpt, readme_path.read_text())
@@ -15,6 +15,13 @@ class Ganeshalingam13Parsing(TestCase, PhotometricDataParsing):
     def setUpClass(cls):
         cls.test_class = Ganeshalingam13()
 
+    def test_positive_flux_errors(self):
+        """Test formatted flux errors are positive"""
+
+        test_id = self.test_class.get_available_ids()[0]
+        test_data = self.test_class.get_data_for_id(test_id, format_table=True)
+        self.assertTrue((test_data['fluxerr'] > 0).all())
+
 
 class Ganeshalingam13UI(TestCase, PhotometricDataUI):
     """UI tests for the Ganeshalingam13 release"""
@@ -2,8 +2,11 @@
 
 import os
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
+import sncosmo
+
 import sndata
 from sndata.exceptions import NoDownloadedData
 from sndata.utils import data_parsing
@@ -49,6 +52,17 @@ class FindDataDir(TestCase):
         self.assertEqual(recovered_dir, expected_path)
 
 
+class FindCacheDir(TestCase):
+    """Tests for the ``find_cache_dir`` function"""
+
+    def test_cache_dir_shares_data_root(self):
+        """Test cache directories are kept in a cache folder of the data root"""
+
+        data_root = data_parsing.find_data_dir('dummy_survey', 'dummy_release').parent.parent
+        recovered_dir = data_parsing.find_cache_dir('Dummy Cache')
+        self.assertEqual(data_root / 'cache' / 'dummy_cache', recovered_dir)
+
+
 class RequireDataPath(TestCase):
     """Tests for the ``require_data_path`` function"""
 
@@ -57,3 +71,93 @@ class RequireDataPath(TestCase):
 
         fake_dir = Path('./This_dir_is_fake')
         self.assertRaises(NoDownloadedData, data_parsing.require_data_path, fake_dir)
+
+
+class ParseVizierTableDescriptions(TestCase):
+    """Tests for the ``parse_vizier_table_descriptions`` function"""
+
+    readme_template = (
+        'File Summary:\n'
+        '--------------------------------------------------------------------------------\n'
+        ' FileName      Lrecl  Records   Explanations\n'
+        '--------------------------------------------------------------------------------\n'
+        'ReadMe            80        .   This file\n'
+        'table1.dat        50       10   {}\n'
+        '--------------------------------------------------------------------------------\n'
+    )
+
+    def test_modified_file_is_parsed_again(self):
+        """Test cached descriptions are not reused after a file is edited"""
+
+        with TemporaryDirectory() as temp_dir:
+            readme_path = Path(temp_dir) / 'ReadMe'
+            readme_path.write_text(self.readme_template.format('First description'))
+            first = data_parsing.parse_vizier_table_descriptions(readme_path)
+
+            readme_path.write_text(self.readme_template.format('Second description'))
+            os.utime(readme_path, ns=(0, readme_path.stat().st_mtime_ns + 1))
+            second = data_parsing.parse_vizier_table_descriptions(readme_path)
+
+        self.assertEqual({1: 'First description'}, first)
+        self.assertEqual({1: 'Second description'}, second)
+
+
+class ListFileNames(TestCase):
+    """Tests for the ``list_file_names`` function"""
+
+    def test_filters_by_prefix_and_suffix(self):
+        """Test only matching, non-hidden files are returned"""
+
+        with TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            for name in ('SN1.dat', 'SN2.dat', 'SN3.txt', 'other.dat', '.SN4.dat'):
+                (temp_dir / name).touch()
+
+            (temp_dir / 'SN5.dat').mkdir()
+            file_names = data_parsing.list_file_names(temp_dir, prefix='SN', suffix='.dat')
+
+        self.assertListEqual(['SN1.dat', 'SN2.dat'], sorted(file_names))
+
+    def test_missing_dir_is_empty(self):
+        """Test an empty list is returned for a missing directory"""
+
+        fake_dir = Path('./This_dir_is_fake')
+        self.assertListEqual([], data_parsing.list_file_names(fake_dir))
+
+    def test_recursive_includes_subdirectories(self):
+        """Test files in nested, non-hidden directories are returned"""
+
+        with TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            (temp_dir / 'sub').mkdir()
+            (temp_dir / '.hidden').mkdir()
+            for path in ('table1.dat', 'sub/table2.dat', '.hidden/table3.dat'):
+                (temp_dir / path).touch()
+
+            file_names = data_parsing.list_file_names(temp_dir, prefix='table', recursive=True)
+            top_level_names = data_parsing.list_file_names(temp_dir, prefix='table')
+
+        self.assertListEqual(['table1.dat', 'table2.dat'], sorted(file_names))
+        self.assertListEqual(['table1.dat'], top_level_names)
+
+
+class RegisterFilterFiles(TestCase):
+    """Tests for the ``register_filter_files`` function"""
+
+    def test_filters_are_registered(self):
+        """Test each filter is registered with sncosmo under the given name"""
+
+        filter_names = ['test_register_filter_files_a', 'test_register_filter_files_b']
+        with TemporaryDirectory() as temp_dir:
+            file_paths = [Path(temp_dir) / f'{name}.dat' for name in filter_names]
+            for path in file_paths:
+                path.write_text('4000 0\n5000 1\nnan 1\n6000 0\n')
+
+            available_bands = set()
+            data_parsing.register_filter_files(
+                file_paths, filter_names, available_bands=available_bands)
+
+        self.assertSetEqual(set(filter_names), available_bands)
+        for name in filter_names:
+            band = sncosmo.get_bandpass(name)
+            self.assertListEqual([4000, 5000, 6000], list(band.wave))
@@ -0,0 +1,116 @@
+"""Tests for the ``downloads`` module."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import requests
+
+from sndata.utils import downloads
+
+# Nothing listens on port 1, so requests to this url fail without a network
+_unreachable_url = 'http://127.0.0.1:1/file.txt'
+
+
+class SlowRequestHandler(BaseHTTPRequestHandler):
+    """Serve the request path as file content after a short delay while
+    recording the largest number of requests handled at once
+    """
+
+    lock = threading.Lock()
+    active_requests = 0
+    max_active_requests = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active_requests += 1
+            cls.max_active_requests = max(cls.max_active_requests, cls.active_requests)
+
+        time.sleep(.05)
+        content = self.path.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+        with cls.lock:
+            cls.active_requests -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class GetSession(TestCase):
+    """Tests for the ``_get_session`` function"""
+
+    def test_one_session_per_thread(self):
+        """Test threads reuse their own session and never share one"""
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(executor.map(lambda _: downloads._get_session(), range(2)))
+
+        self.assertIs(downloads._get_session(), downloads._get_session())
+        self.assertNotIn(downloads._get_session(), sessions)
+
+
+class DownloadFiles(TestCase):
+    """Tests for the ``download_files`` function"""
+
+    def test_concurrent_requests_are_bounded(self):
+        """Test nested download pools never exceed the connection limit"""
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SlowRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+
+        def download_group(group_dir):
+            names = [f'file_{i}.txt' for i in range(8)]
+            downloads.download_files(
+                [f'{base_url}/{name}' for name in names],
+                [group_dir / name for name in names],
+                verbose=False)
+
+        try:
+            with TemporaryDirectory() as temp_dir:
+                group_dirs = [Path(temp_dir) / f'group_{i}' for i in range(4)]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    list(executor.map(download_group, group_dirs))
+
+                file_content = (group_dirs[0] / 'file_0.txt').read_text()
+                num_files = len(list(Path(temp_dir).rglob('file_*.txt')))
+
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual('/file_0.txt', file_content)
+        self.assertEqual(32, num_files)
+        self.assertLessEqual(SlowRequestHandler.max_active_requests, downloads._max_connections)
+
+    def test_failed_downloads_leave_no_files(self):
+        """Test no files are left behind when every download fails"""
+
+        with TemporaryDirectory() as temp_dir:
+            destinations = [Path(temp_dir) / f'file_{i}.txt' for i in range(5)]
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                downloads.download_files(
+                    [_unreachable_url] * len(destinations), destinations, verbose=False)
+
+            self.assertListEqual([], list(Path(temp_dir).iterdir()))
+
+    def test_existing_file_kept_on_failure(self):
+        """Test a forced download that fails keeps the existing file"""
+
+        with TemporaryDirectory() as temp_dir:
+            destination = Path(temp_dir) / 'file.txt'
+            destination.write_text('existing data')
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                downloads.download_file(_unreachable_url, destination, force=True, verbose=False)
+
+            self.assertEqual('existing data', destination.read_text())
+            self.assertListEqual([destination], list(Path(temp_dir).iterdir()))
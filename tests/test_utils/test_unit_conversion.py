@@ -43,3 +43,20 @@ class ConvertToJD(TestCase):
         self.assertEqual(
             self.expected_jd, uc.convert_to_jd(self.mjd_date, 'mjd'),
             'Incorrect date for MJD format')
+
+
+class MagToFlux(TestCase):
+    """Tests for the ``mag_to_flux`` function"""
+
+    def test_matches_direct_calculation(self):
+        """Test returned values match the standard magnitude to flux relations"""
+
+        mag = np.array([15., 20., 25.])
+        mag_err = np.array([.1, .2, .3])
+        zp = np.array([25., 25., 27.5])
+        flux, fluxerr = uc.mag_to_flux(mag, mag_err, zp)
+
+        expected_flux = 10 ** ((mag - zp) / -2.5)
+        expected_fluxerr = np.log(10) / 2.5 * expected_flux * mag_err
+        np.testing.assert_allclose(expected_flux, flux)
+        np.testing.assert_allclose(expected_fluxerr, fluxerr)
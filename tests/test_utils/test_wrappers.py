@@ -0,0 +1,32 @@
+"""Tests for the ``wrappers`` module."""
+
+from unittest import TestCase
+
+from sndata.utils import wrappers
+
+
+class ProcessMap(TestCase):
+    """Tests for the ``process_map`` function"""
+
+    def test_results_are_ordered(self):
+        """Test results are yielded in the same order as the input values"""
+
+        results = wrappers.process_map(str, range(20), n_jobs=2)
+        self.assertListEqual([str(i) for i in range(20)], list(results))
+
+    def test_values_are_submitted_lazily(self):
+        """Test input values are not all submitted before results are used"""
+
+        pulled_values = []
+
+        def values():
+            for i in range(100):
+                pulled_values.append(i)
+                yield i
+
+        results = wrappers.process_map(str, values(), n_jobs=2, lookahead=2)
+        self.assertEqual('0', next(results))
+        results.close()
+
+        # Four values are submitted up front and one more per result
+        self.assertListEqual([0, 1, 2, 3, 4], pulled_values)